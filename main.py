@@ -3,6 +3,7 @@ Enduraw Testing Tool - Entry Point
 """
 import os
 import sys
+import multiprocessing
 from pathlib import Path
 
 
@@ -41,5 +42,7 @@ from src.main_session import TCPDataProcessorSession
 
 
 if __name__ == "__main__":
+    # Export worker processes re-run this module in frozen (PyInstaller) builds
+    multiprocessing.freeze_support()
     app = TCPDataProcessorSession()
     app.mainloop()
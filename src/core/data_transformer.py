@@ -10,6 +10,9 @@ from core.models import (
 )
 from config import GRAPH_COLORS, GRAPH_INTERVAL_SECONDS
 
+# Measurement fields that are not averaged into the graph intervals
+_AGG_SKIP_KEYS = frozenset(('t', 't_seconds', 'Phase', 'Marqueur'))
+
 
 class DataTransformer:
     """Transform and merge XML data with manual input for MongoDB export"""
@@ -360,7 +363,8 @@ class DataTransformer:
         
         aggregated = []
         current_interval = 0
-        current_values = {}
+        # key -> non-None values of the interval (keys kept in first-seen order)
+        current_values: Dict[str, List[Any]] = {}
         count = 0
         
         for m in measurements:
@@ -370,39 +374,39 @@ class DataTransformer:
             if interval != current_interval:
                 # Save previous interval if we have data
                 if count > 0:
-                    avg_values = {'t_seconds': current_interval}
-                    for key, values in current_values.items():
-                        if values:
-                            valid_values = [v for v in values if v is not None]
-                            if valid_values:
-                                avg_values[key] = round(sum(valid_values) / len(valid_values), 2)
-                    aggregated.append(avg_values)
+                    aggregated.append(self._average_interval(current_interval, current_values))
                 
                 # Start new interval
                 current_interval = interval
                 current_values = {}
                 count = 0
             
-            # Accumulate values
+            # Accumulate values, None is dropped here rather than filtered later
             for key, value in m.items():
-                if key not in ['t', 't_seconds', 'Phase', 'Marqueur']:
-                    if key not in current_values:
-                        current_values[key] = []
-                    current_values[key].append(value)
+                if key in _AGG_SKIP_KEYS:
+                    continue
+                values = current_values.get(key)
+                if values is None:
+                    values = current_values[key] = []
+                if value is not None:
+                    values.append(value)
             count += 1
         
         # Don't forget last interval
         if count > 0:
-            avg_values = {'t_seconds': current_interval}
-            for key, values in current_values.items():
-                if values:
-                    valid_values = [v for v in values if v is not None]
-                    if valid_values:
-                        avg_values[key] = round(sum(valid_values) / len(valid_values), 2)
-            aggregated.append(avg_values)
+            aggregated.append(self._average_interval(current_interval, current_values))
         
         return aggregated
     
+    @staticmethod
+    def _average_interval(interval: int, values_by_key: Dict[str, List[Any]]) -> Dict[str, Any]:
+        """Mean (2 decimals) of each key's values over one interval"""
+        avg_values = {'t_seconds': interval}
+        for key, values in values_by_key.items():
+            if values:
+                avg_values[key] = round(sum(values) / len(values), 2)
+        return avg_values
+    
     def _build_zones_seuils(self, aggregated: List[Dict], seuils: Dict[str, Any]) -> List[ZoneSeuil]:
         """Build threshold zones from aggregated data and seuils"""
         zones = []
@@ -0,0 +1,30 @@
+"""
+Export worker - XML parse + transform step, run in worker processes
+by "Exporter tout" (module-level so it can be pickled by reference)
+"""
+from typing import Dict, Any, Optional
+
+from utils.xml_parser import parse_file_cached
+from core.data_transformer import DataTransformer
+
+# Built once per worker process
+_transformer: Optional[DataTransformer] = None
+
+
+def parse_and_transform(xml_path: str, profile_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse one TCP XML file and merge it with its profile.
+    
+    Args:
+        xml_path: Path to the XML file
+        profile_data: Profile the XML is matched with
+        
+    Returns:
+        Export-ready output dictionary
+    """
+    global _transformer
+    if _transformer is None:
+        _transformer = DataTransformer()
+    # The pool outlives a batch, so re-exports in a worker skip the parse
+    xml_data = parse_file_cached(xml_path)
+    return _transformer.transform(xml_data, profile_data)
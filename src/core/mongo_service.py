@@ -9,6 +9,9 @@ URI resolution order:
 """
 import os
 import json
+import time
+import threading
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
@@ -42,6 +45,15 @@ class MongoService:
     # Persistent config file for the URI (next to sessions/)
     _CONFIG_FILENAME = "mongo_config.json"
 
+    # Connection pool: a couple of sockets stay warm for lookups, the cap
+    # covers the UI plus background workers
+    _MIN_POOL_SIZE = 2
+    _MAX_POOL_SIZE = 20
+
+    # Email lookups are cached briefly so repeated clicks skip the DB
+    _EMAIL_CACHE_SIZE = 256
+    _EMAIL_CACHE_TTL = 60.0  # seconds
+
     def __init__(self, base_path: str):
         self.base_path = base_path
         self._client = None
@@ -51,7 +63,11 @@ class MongoService:
         self.db_name: str = "enduraw"
         self.collection_name: str = "completeUser"
         self.is_connected: bool = False
-        self._users_cache: List[Dict[str, Any]] = []
+        # Loaded on first get_all_users(), None until then
+        self._users_cache: Optional[List[Dict[str, Any]]] = None
+        # email -> (fetched_at, doc or None), oldest first
+        self._email_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        self._email_cache_lock = threading.Lock()
 
         # Try to load saved URI
         self._load_config()
@@ -136,9 +152,16 @@ class MongoService:
         # Close previous connection if any
         self.disconnect()
 
-        self._client = MongoClient(self.uri, serverSelectionTimeoutMS=5000)
+        # TCP keep-alive is always on in pymongo 4, only the pool is sized
+        self._client = MongoClient(
+            self.uri,
+            serverSelectionTimeoutMS=5000,
+            minPoolSize=self._MIN_POOL_SIZE,
+            maxPoolSize=self._MAX_POOL_SIZE,
+            connect=True,
+        )
 
-        # Force a server check to validate connection
+        # Force a server check to validate connection (and prime the pool)
         self._client.admin.command("ping")
 
         self._db = self._client[self.db_name]
@@ -148,9 +171,6 @@ class MongoService:
         # Persist working config
         self._save_config()
 
-        # Pre-load users cache
-        self._refresh_cache()
-
         return True
 
     def disconnect(self):
@@ -163,7 +183,8 @@ class MongoService:
         self._db = None
         self._collection = None
         self.is_connected = False
-        self._users_cache.clear()
+        self._users_cache = None
+        self.invalidate_email_cache()
 
     # ------------------------------------------------------------------ #
     #  Users cache                                                        #
@@ -199,13 +220,38 @@ class MongoService:
             self._users_cache = []
 
     def get_all_users(self) -> List[Dict[str, Any]]:
-        """Return cached users list."""
-        return list(self._users_cache)
+        """Return cached users list (loaded on first call)."""
+        if self._users_cache is None:
+            self._refresh_cache()
+        return list(self._users_cache or [])
+
+    def count_users(self) -> int:
+        """
+        Number of users in the collection.
+        Uses the cache when loaded, else one count command (no document transfer).
+        """
+        if self._users_cache is not None:
+            return len(self._users_cache)
+        if not self._collection_ready():
+            return 0
+        try:
+            return self._collection.estimated_document_count()
+        except Exception:
+            return 0
 
     def refresh_users(self):
         """Force-refresh user cache from DB."""
+        self.invalidate_email_cache()
         self._refresh_cache()
 
+    def invalidate_email_cache(self, email: str = ""):
+        """Drop the cached lookup for one email, or all of them."""
+        with self._email_cache_lock:
+            if email:
+                self._email_cache.pop(email.lower().strip(), None)
+            else:
+                self._email_cache.clear()
+
     # ------------------------------------------------------------------ #
     #  User lookup                                                        #
     # ------------------------------------------------------------------ #
@@ -213,17 +259,30 @@ class MongoService:
         """
         Find a user in the DB by email (full document).
         Returns None if not found or not connected.
+        Results (including misses) are cached for _EMAIL_CACHE_TTL seconds.
         """
         if not self._collection_ready() or not email:
             return None
+        key = email.lower().strip()
+        now = time.monotonic()
+        with self._email_cache_lock:
+            hit = self._email_cache.get(key)
+            if hit is not None and now - hit[0] < self._EMAIL_CACHE_TTL:
+                self._email_cache.move_to_end(key)
+                return dict(hit[1]) if hit[1] is not None else None
         try:
             doc = self._collection.find_one(
-                {"email": email.lower().strip()},
+                {"email": key},
                 {"_id": 0, "password": 0, "stravaRefreshToken": 0}
             )
-            return doc
         except Exception:
             return None
+        with self._email_cache_lock:
+            self._email_cache[key] = (now, doc)
+            self._email_cache.move_to_end(key)
+            while len(self._email_cache) > self._EMAIL_CACHE_SIZE:
+                self._email_cache.popitem(last=False)
+        return dict(doc) if doc is not None else None
 
     # ------------------------------------------------------------------ #
     #  Mapping DB user -> profile form fields                             #
@@ -24,21 +24,23 @@ class ProtocolStore:
     def __init__(self, base_path: str):
         self._path = os.path.join(base_path, _FILENAME)
         self._protocols: List[Dict[str, str]] = []
+        # name -> protocol entry and the sorted names, rebuilt on add/rename/delete
+        self._by_name: Dict[str, Dict[str, str]] = {}
+        self._names: List[str] = []
         self._load()
+        self._reindex()
 
     # ------------------------------------------------------------------ #
     #  Public API                                                         #
     # ------------------------------------------------------------------ #
     def list_names(self) -> List[str]:
         """Return sorted list of protocol names."""
-        return [p["name"] for p in self._protocols]
+        return list(self._names)
 
     def get_description(self, name: str) -> str:
         """Return the description for a given protocol name, or ''."""
-        for p in self._protocols:
-            if p["name"] == name:
-                return p.get("description", "")
-        return ""
+        p = self._by_name.get(name)
+        return p.get("description", "") if p is not None else ""
 
     def add(self, name: str, description: str) -> bool:
         """
@@ -47,44 +49,50 @@ class ProtocolStore:
         name = name.strip()
         if not name:
             return False
-        if any(p["name"] == name for p in self._protocols):
+        if name in self._by_name:
             return False
         self._protocols.append({"name": name, "description": description.strip()})
         self._protocols.sort(key=lambda p: p["name"].lower())
+        self._reindex()
         self._save()
         return True
 
     def update(self, name: str, description: str):
         """Update the description of an existing protocol."""
-        for p in self._protocols:
-            if p["name"] == name:
-                p["description"] = description.strip()
-                self._save()
-                return
+        p = self._by_name.get(name)
+        if p is not None:
+            p["description"] = description.strip()
+            self._save()
 
     def rename(self, old_name: str, new_name: str) -> bool:
         """Rename a protocol.  Returns False if new_name already exists."""
         new_name = new_name.strip()
         if not new_name or old_name == new_name:
             return False
-        if any(p["name"] == new_name for p in self._protocols):
+        if new_name in self._by_name:
             return False
-        for p in self._protocols:
-            if p["name"] == old_name:
-                p["name"] = new_name
-                self._protocols.sort(key=lambda p: p["name"].lower())
-                self._save()
-                return True
-        return False
+        p = self._by_name.get(old_name)
+        if p is None:
+            return False
+        p["name"] = new_name
+        self._protocols.sort(key=lambda p: p["name"].lower())
+        self._reindex()
+        self._save()
+        return True
 
     def delete(self, name: str):
         """Delete a protocol by name."""
         self._protocols = [p for p in self._protocols if p["name"] != name]
+        self._reindex()
         self._save()
 
     # ------------------------------------------------------------------ #
     #  Persistence                                                        #
     # ------------------------------------------------------------------ #
+    def _reindex(self):
+        self._by_name = {p["name"]: p for p in self._protocols}
+        self._names = [p["name"] for p in self._protocols]
+
     def _load(self):
         if os.path.exists(self._path):
             try:
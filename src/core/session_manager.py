@@ -2,16 +2,47 @@
 Session Manager - Handles sessions and profiles for TCP Data Processor
 """
 import os
+import sys
 import json
-import shutil
-import uuid
+import threading
 from datetime import datetime
 from pathlib import Path
-from dataclasses import dataclass, field, asdict
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Tuple
 
+from utils.json_io import dumps_json
 
-@dataclass
+
+def _atomic_write_bytes(path: Path, data: bytes):
+    """Write data to a temp file next to path, then swap it in place"""
+    # Per-thread temp name, concurrent writers of one path must not share it
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def profile_display_name(identity: Optional[Dict[str, Any]]) -> str:
+    """'LASTNAME Firstname' of a profile identity, '' if both are empty"""
+    identity = identity or {}
+    last_name = (identity.get('last_name') or '').strip()
+    first_name = (identity.get('first_name') or '').strip()
+    return f"{last_name} {first_name}".strip()
+
+
+def _intern(value: Any) -> Any:
+    """Intern short repeated strings (filenames used as lookup keys)"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class Session:
     """Session metadata"""
     name: str
@@ -21,7 +52,13 @@ class Session:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'name': self.name,
+            'date': self.date,
+            'location': self.location,
+            'description': self.description,
+            'created_at': self.created_at
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Session':
@@ -34,7 +71,7 @@ class Session:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileMatch:
     """Tracks profile-XML matching"""
     profile_name: str
@@ -43,18 +80,33 @@ class ProfileMatch:
     exported: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            'profile_name': self.profile_name,
+            'xml_filename': self.xml_filename,
+            'matched_at': self.matched_at,
+            'exported': self.exported
+        }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'ProfileMatch':
         return cls(
-            profile_name=data.get('profile_name', ''),
-            xml_filename=data.get('xml_filename', ''),
+            profile_name=_intern(data.get('profile_name', '')),
+            xml_filename=_intern(data.get('xml_filename', '')),
             matched_at=data.get('matched_at', datetime.now().isoformat()),
             exported=data.get('exported', False)
         )
 
 
+@dataclass(frozen=True, slots=True)
+class SessionSnapshot:
+    """Folders and date of a session, captured on the UI thread for background work"""
+    path: Path
+    date: str
+    profiles_dir: Path
+    xml_dir: Path
+    output_dir: Path
+
+
 class SessionManager:
     """Manages sessions and profiles"""
     
@@ -77,6 +129,51 @@ class SessionManager:
         self.current_session: Optional[Session] = None
         self.current_session_path: Optional[Path] = None
         self.matches: List[ProfileMatch] = []
+        # Names present in self.matches, kept in sync with it
+        self._matched_profiles: set = set()
+        self._matched_xmls: set = set()
+        self._profiles_dir: Optional[Path] = None
+        self._xml_dir: Optional[Path] = None
+        self._output_dir: Optional[Path] = None
+        self._matches_file: Optional[Path] = None
+        # XML filename -> full path, filled by one scan and kept up to date
+        # by the import methods
+        self._xml_index: Optional[Dict[str, str]] = None
+        # Profile filename -> (mtime_ns, size, list_profiles fields), so a
+        # refresh only re-reads the profile JSONs that changed
+        self._profile_summaries: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+        # Last bytes written to / read from matches.json
+        self._last_matches_bytes: Optional[bytes] = None
+        # Guards the session paths, the XML index and matches.json writes,
+        # which worker threads use while the UI thread may switch sessions
+        self._lock = threading.RLock()
+    
+    def _set_session_path(self, path: Optional[Path]):
+        """Set current session folder and cache its sub-paths"""
+        with self._lock:
+            self.current_session_path = path
+            self._last_matches_bytes = None
+            self._xml_index = None
+            self._profile_summaries = {}
+            if path is None:
+                self._profiles_dir = self._xml_dir = self._output_dir = self._matches_file = None
+            else:
+                self._profiles_dir = path / self.PROFILES_DIR
+                self._xml_dir = path / self.XML_DIR
+                self._output_dir = path / self.OUTPUT_DIR
+                self._matches_file = path / self.MATCHES_FILE
+    
+    def snapshot(self) -> Optional[SessionSnapshot]:
+        """Folders and date of the current session, or None if none is loaded"""
+        with self._lock:
+            if not self.current_session_path:
+                return None
+            return SessionSnapshot(self.current_session_path, self.current_session.date,
+                                   self._profiles_dir, self._xml_dir, self._output_dir)
+    
+    def is_current(self, snapshot: SessionSnapshot) -> bool:
+        """True if snapshot was taken from the session that is still loaded"""
+        return self.current_session_path == snapshot.path
     
     def _ensure_sessions_dir(self):
         """Ensure Sessions directory exists"""
@@ -90,6 +187,53 @@ class SessionManager:
         sanitized = ''.join(c for c in sanitized if c.isalnum() or c in '_-')
         return sanitized
     
+    def _unique_filename(self, directory: Path, stem: str, suffix: str,
+                         current: str = "") -> str:
+        """
+        Find a free filename in directory with a single scandir.
+        
+        Args:
+            directory: Target directory
+            stem: Wanted file stem
+            suffix: File suffix (with dot)
+            current: Filename allowed to be reused (file being renamed)
+            
+        Returns:
+            First of stem+suffix, stem_1+suffix, ... not already taken
+        """
+        existing = self._list_names(directory)
+        existing.discard(current)
+        return self._pick_free_name(existing, stem, suffix)
+    
+    @staticmethod
+    def _list_names(directory: Path) -> set:
+        """Names of all entries in directory (single scandir)"""
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    
+    @staticmethod
+    def _scan_files(directory: Path, suffix: str) -> List[os.DirEntry]:
+        """
+        Files of directory ending with suffix (case-insensitive on Windows).
+        
+        DirEntry caches is_file()/stat() (free on Windows), so callers get
+        them without extra syscalls. The entries are only a snapshot of
+        this scan and should not be kept around.
+        """
+        with os.scandir(directory) as entries:
+            return [entry for entry in entries
+                    if os.path.normcase(entry.name).endswith(suffix) and entry.is_file()]
+    
+    @staticmethod
+    def _pick_free_name(existing: set, stem: str, suffix: str) -> str:
+        """First of stem+suffix, stem_1+suffix, ... not in existing"""
+        filename = f"{stem}{suffix}"
+        counter = 1
+        while filename in existing:
+            filename = f"{stem}_{counter}{suffix}"
+            counter += 1
+        return filename
+    
     # ==================== SESSION OPERATIONS ====================
     
     def create_session(self, date: str, location: str, description: str = "") -> Session:
@@ -128,19 +272,17 @@ class SessionManager:
         )
         
         # Save session.json
-        session_file = session_path / self.SESSION_FILE
-        with open(session_file, 'w', encoding='utf-8') as f:
-            json.dump(session.to_dict(), f, indent=2, ensure_ascii=False)
+        _atomic_write_bytes(session_path / self.SESSION_FILE, dumps_json(session.to_dict()))
         
         # Initialize empty matches
-        matches_file = session_path / self.MATCHES_FILE
-        with open(matches_file, 'w', encoding='utf-8') as f:
-            json.dump([], f)
+        _atomic_write_bytes(session_path / self.MATCHES_FILE, b"[]")
         
         # Set as current session
         self.current_session = session
-        self.current_session_path = session_path
+        self._set_session_path(session_path)
         self.matches = []
+        self._reindex_matches()
+        self._last_matches_bytes = b"[]"
         
         return session
     
@@ -167,7 +309,7 @@ class SessionManager:
         
         # Set as current session
         self.current_session = session
-        self.current_session_path = path
+        self._set_session_path(path)
         
         # Load matches
         self._load_matches()
@@ -184,17 +326,18 @@ class SessionManager:
         self._ensure_sessions_dir()
         sessions = []
         
-        for item in self.sessions_path.iterdir():
-            if item.is_dir():
-                session_file = item / self.SESSION_FILE
-                if session_file.exists():
-                    try:
-                        with open(session_file, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        data['path'] = str(item)
-                        sessions.append(data)
-                    except Exception:
-                        pass
+        with os.scandir(self.sessions_path) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                # A folder without session.json simply fails to open
+                try:
+                    with open(os.path.join(entry.path, self.SESSION_FILE), 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    data['path'] = entry.path
+                    sessions.append(data)
+                except Exception:
+                    pass
         
         # Sort by date descending
         sessions.sort(key=lambda x: x.get('date', ''), reverse=True)
@@ -204,22 +347,26 @@ class SessionManager:
         """Delete a session and all its contents"""
         path = Path(session_path)
         if path.exists() and path.is_dir():
+            import shutil
             shutil.rmtree(path)
             if self.current_session_path == path:
                 self.current_session = None
-                self.current_session_path = None
+                self._set_session_path(None)
                 self.matches = []
+                self._reindex_matches()
             return True
         return False
     
     # ==================== PROFILE OPERATIONS ====================
     
-    def add_profile(self, profile_data: Dict[str, Any]) -> str:
+    def add_profile(self, profile_data: Dict[str, Any], *,
+                    raw_bytes: Optional[bytes] = None) -> str:
         """
         Add a new profile to current session.
         
         Args:
             profile_data: Profile data dictionary
+            raw_bytes: Already-encoded JSON to write instead of profile_data
             
         Returns:
             Profile filename
@@ -238,26 +385,24 @@ class SessionManager:
             safe_name = "forms_" + self._sanitize_name('_'.join(name_parts))
         else:
             # No name provided - use UUID
+            import uuid
             safe_name = f"forms_nouveau_profil_{uuid.uuid4().hex[:8]}"
         
         # Ensure we have a valid name
         if not safe_name:
+            import uuid
             safe_name = f"forms_profil_{uuid.uuid4().hex[:8]}"
         
-        filename = f"{safe_name}.json"
-        
         # Handle duplicates
-        profiles_dir = self.current_session_path / self.PROFILES_DIR
+        profiles_dir = self._profiles_dir
+        filename = self._unique_filename(profiles_dir, safe_name, ".json")
         filepath = profiles_dir / filename
-        counter = 1
-        while filepath.exists():
-            filename = f"{safe_name}_{counter}.json"
-            filepath = profiles_dir / filename
-            counter += 1
         
         # Save profile
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(profile_data, f, indent=2, ensure_ascii=False)
+        if raw_bytes is None:
+            raw_bytes = dumps_json(profile_data)
+        _atomic_write_bytes(filepath, raw_bytes)
+        self._profile_summaries.pop(filename, None)
         
         return filename
     
@@ -275,7 +420,7 @@ class SessionManager:
         if not self.current_session_path:
             raise ValueError("No session loaded")
         
-        profiles_dir = self.current_session_path / self.PROFILES_DIR
+        profiles_dir = self._profiles_dir
         filepath = profiles_dir / filename
         if not filepath.exists():
             return ""
@@ -301,16 +446,17 @@ class SessionManager:
         # Handle rename if filename changed
         if new_filename != filename:
             # Handle duplicates
-            counter = 1
-            while new_filepath.exists() and new_filepath != filepath:
-                new_filename = f"{new_safe_name}_{counter}.json"
-                new_filepath = profiles_dir / new_filename
-                counter += 1
+            new_filename = self._unique_filename(
+                profiles_dir, new_safe_name, ".json", current=filename)
+            new_filepath = profiles_dir / new_filename
             
             # Update any matches pointing to old filename
             for match in self.matches:
                 if match.profile_name == filename:
                     match.profile_name = new_filename
+            if filename in self._matched_profiles:
+                self._matched_profiles.discard(filename)
+                self._matched_profiles.add(new_filename)
             self._save_matches()
             
             # Rename file
@@ -319,25 +465,37 @@ class SessionManager:
                 filepath = new_filepath
         
         # Save updated data
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(profile_data, f, indent=2, ensure_ascii=False)
+        _atomic_write_bytes(filepath, dumps_json(profile_data))
+        # Don't trust mtime alone for our own writes (coarse on some filesystems)
+        self._profile_summaries.pop(filename, None)
+        self._profile_summaries.pop(new_filename, None)
         
         return new_filename
     
-    def get_profile(self, filename: str) -> Optional[Dict[str, Any]]:
+    def profile_exists(self, filename: str) -> bool:
+        """Check whether a profile file exists without reading it"""
+        if not self.current_session_path or not filename:
+            return False
+        return (self._profiles_dir / filename).is_file()
+    
+    def get_profile(self, filename: str, profiles_dir: Optional[Path] = None) -> Optional[Dict[str, Any]]:
         """
         Get a profile by filename.
         
         Args:
             filename: Profile filename
+            profiles_dir: Profiles folder of a captured session, instead of
+                the current one
             
         Returns:
             Profile data or None
         """
-        if not self.current_session_path:
-            return None
+        if profiles_dir is None:
+            if not self.current_session_path:
+                return None
+            profiles_dir = self._profiles_dir
         
-        filepath = self.current_session_path / self.PROFILES_DIR / filename
+        filepath = profiles_dir / filename
         if not filepath.exists():
             return None
         
@@ -355,27 +513,45 @@ class SessionManager:
             return []
         
         profiles = []
-        profiles_dir = self.current_session_path / self.PROFILES_DIR
+        profiles_dir = self._profiles_dir
         
         if not profiles_dir.exists():
             return []
         
-        for item in profiles_dir.glob("*.json"):
+        summaries = self._profile_summaries
+        seen = set()
+        for entry in self._scan_files(profiles_dir, '.json'):
             try:
-                with open(item, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                st = entry.stat()
+                cached = summaries.get(entry.name)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    summary = cached[2]
+                else:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    
+                    identity = data.get('identity', {}) or {}
+                    summary = {
+                        'last_name': (identity.get('last_name') or ''),
+                        'first_name': (identity.get('first_name') or ''),
+                        'display_name': profile_display_name(identity),
+                        'email': (data.get('email') or ''),
+                    }
+                    summaries[entry.name] = (st.st_mtime_ns, st.st_size, summary)
                 
-                identity = data.get('identity', {}) or {}
+                seen.add(entry.name)
                 profiles.append({
-                    'filename': item.name,
-                    'last_name': (identity.get('last_name') or ''),
-                    'first_name': (identity.get('first_name') or ''),
-                    'email': (data.get('email') or ''),
-                    'path': str(item)
+                    'filename': _intern(entry.name),
+                    **summary,
+                    'path': entry.path
                 })
             except Exception:
                 pass
         
+        # Forget deleted/renamed profiles
+        for name in summaries.keys() - seen:
+            del summaries[name]
+        
         # Sort by last name (handle None/empty safely)
         profiles.sort(key=lambda x: (x.get('last_name') or '').lower())
         return profiles
@@ -385,11 +561,11 @@ class SessionManager:
         if not self.current_session_path:
             return False
         
-        filepath = self.current_session_path / self.PROFILES_DIR / filename
+        filepath = self._profiles_dir / filename
         if filepath.exists():
             filepath.unlink()
             # Remove any matches for this profile
-            self.matches = [m for m in self.matches if m.profile_name != filename]
+            self._drop_profile_matches(filename)
             self._save_matches()
             return True
         return False
@@ -413,19 +589,72 @@ class SessionManager:
         if not source.exists():
             raise FileNotFoundError(f"XML file not found: {xml_path}")
         
-        dest_dir = self.current_session_path / self.XML_DIR
-        dest = dest_dir / source.name
+        dest_dir = self._xml_dir
         
         # Handle duplicates
-        counter = 1
-        while dest.exists():
-            stem = source.stem
-            dest = dest_dir / f"{stem}_{counter}{source.suffix}"
-            counter += 1
+        dest = dest_dir / self._unique_filename(dest_dir, source.stem, source.suffix)
         
+        import shutil
         shutil.copy2(source, dest)
+        self._index_xml(dest)
         return dest.name
     
+    def import_xmls_bulk(self, xml_paths: Sequence[str],
+                         dest_dir: Optional[Path] = None) -> List[Dict[str, Any]]:
+        """
+        Import several XML files to current session.
+        
+        Destination names are reserved up front from a single directory
+        listing, then the copies run in a thread pool.
+        
+        Args:
+            xml_paths: Paths to XML files
+            dest_dir: XML folder of a captured session, background imports
+                pass it so a session switch can't redirect them
+            
+        Returns:
+            One dict per input path, in order, with 'source', 'filename'
+            (imported name, or None) and 'error' (message, or None)
+        """
+        if dest_dir is None:
+            with self._lock:
+                if not self.current_session_path:
+                    raise ValueError("No session loaded")
+                dest_dir = self._xml_dir
+        
+        import shutil
+        from concurrent.futures import ThreadPoolExecutor
+        
+        existing = self._list_names(dest_dir)
+        results = []
+        jobs = []
+        for xml_path in xml_paths:
+            source = Path(xml_path)
+            result = {'source': str(xml_path), 'filename': None, 'error': None}
+            results.append(result)
+            if not source.is_file():
+                result['error'] = f"XML file not found: {xml_path}"
+                continue
+            filename = self._pick_free_name(existing, source.stem, source.suffix)
+            existing.add(filename)
+            jobs.append((result, source, dest_dir / filename))
+        
+        if not jobs:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as pool:
+            futures = [(result, dest, pool.submit(shutil.copy2, source, dest))
+                       for result, source, dest in jobs]
+            for result, dest, future in futures:
+                try:
+                    future.result()
+                    result['filename'] = dest.name
+                    self._index_xml(dest)
+                except Exception as e:
+                    result['error'] = str(e)
+        
+        return results
+    
     def list_xmls(self) -> List[Dict[str, Any]]:
         """
         List all XML files in current session.
@@ -437,61 +666,130 @@ class SessionManager:
             return []
         
         xmls = []
-        xml_dir = self.current_session_path / self.XML_DIR
+        xml_dir = self._xml_dir
         
         if not xml_dir.exists():
             return []
         
-        for item in xml_dir.glob("*.xml"):
+        for entry in self._scan_files(xml_dir, '.xml'):
             # Try to extract info from filename (TCP_LASTNAME_Firstname_date.xml)
-            parts = item.stem.split('_')
+            parts = os.path.splitext(entry.name)[0].split('_')
             last_name = parts[1] if len(parts) > 1 else ''
             first_name = parts[2] if len(parts) > 2 else ''
             
             xmls.append({
-                'filename': item.name,
+                'filename': _intern(entry.name),
                 'last_name': last_name,
                 'first_name': first_name,
-                'path': str(item),
-                'size': item.stat().st_size
+                'path': entry.path,
+                'size': entry.stat().st_size
             })
         
         return xmls
     
     def get_xml_path(self, filename: str) -> Optional[str]:
         """Get full path to an XML file"""
-        if not self.current_session_path:
-            return None
+        with self._lock:
+            if not self.current_session_path:
+                return None
+            
+            index = self._xml_index
+            if index is None:
+                index = self._rebuild_xml_index()
+            path = index.get(filename)
+            if path is not None:
+                # May have been deleted or renamed outside the app since indexed
+                if os.path.exists(path):
+                    return path
+                index.pop(filename, None)
+                return None
+            # Not indexed yet (copied in by hand?), check the disk once
+            filepath = self._xml_dir / filename
+            if filepath.exists():
+                path = str(filepath)
+                index[_intern(filename)] = path
+            return path
+    
+    def scan_xml_paths(self) -> Dict[str, str]:
+        """
+        Map every XML filename of the session to its full path.
         
-        filepath = self.current_session_path / self.XML_DIR / filename
-        if filepath.exists():
-            return str(filepath)
-        return None
+        Rescans the folder (one scandir), for callers that resolve many
+        XMLs at once and want an up-to-date view.
+        """
+        with self._lock:
+            if not self.current_session_path:
+                return {}
+            return dict(self._rebuild_xml_index())
+    
+    def _rebuild_xml_index(self) -> Dict[str, str]:
+        """Scan the XML folder into self._xml_index"""
+        # Held across the scan, so a session switch can't land in between
+        # and leave the old session's index in place
+        with self._lock:
+            index = {}
+            if self._xml_dir.is_dir():
+                with os.scandir(self._xml_dir) as entries:
+                    index = {_intern(entry.name): entry.path for entry in entries
+                             if entry.is_file(follow_symlinks=False)}
+            self._xml_index = index
+            return index
+    
+    def _index_xml(self, path: Path):
+        """Record a newly imported XML in the index (if built for its session)"""
+        with self._lock:
+            # An import into a session that is no longer loaded stays out
+            if self._xml_index is not None and path.parent == self._xml_dir:
+                self._xml_index[_intern(path.name)] = str(path)
     
     # ==================== MATCHING OPERATIONS ====================
     
+    def _reindex_matches(self):
+        """Rebuild matched name sets after self.matches was replaced"""
+        self._matched_profiles = {m.profile_name for m in self.matches}
+        self._matched_xmls = {m.xml_filename for m in self.matches}
+    
+    def _drop_profile_matches(self, profile_filename: str) -> bool:
+        """Remove matches of a profile from memory, returns True if any"""
+        if profile_filename not in self._matched_profiles:
+            return False
+        kept = []
+        for m in self.matches:
+            if m.profile_name == profile_filename:
+                self._matched_xmls.discard(m.xml_filename)
+            else:
+                kept.append(m)
+        self.matches = kept
+        self._matched_profiles.discard(profile_filename)
+        return True
+    
     def _load_matches(self):
         """Load matches from file"""
         if not self.current_session_path:
             self.matches = []
+            self._reindex_matches()
             return
         
-        matches_file = self.current_session_path / self.MATCHES_FILE
+        matches_file = self._matches_file
         if matches_file.exists():
-            with open(matches_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            self.matches = [ProfileMatch.from_dict(m) for m in data]
+            raw = matches_file.read_bytes()
+            self.matches = [ProfileMatch.from_dict(m) for m in json.loads(raw)]
+            self._last_matches_bytes = raw
         else:
             self.matches = []
+        self._reindex_matches()
     
     def _save_matches(self):
         """Save matches to file"""
-        if not self.current_session_path:
-            return
-        
-        matches_file = self.current_session_path / self.MATCHES_FILE
-        with open(matches_file, 'w', encoding='utf-8') as f:
-            json.dump([m.to_dict() for m in self.matches], f, indent=2)
+        with self._lock:
+            if not self.current_session_path:
+                return
+            
+            data = dumps_json([m.to_dict() for m in self.matches])
+            if data == self._last_matches_bytes:
+                return
+            _atomic_write_bytes(self._matches_file, data)
+            self._last_matches_bytes = data
     
     def create_match(self, profile_filename: str, xml_filename: str) -> ProfileMatch:
         """
@@ -505,31 +803,79 @@ class SessionManager:
             Created ProfileMatch
         """
         # Remove any existing match for this profile or XML
-        self.matches = [m for m in self.matches 
-                       if m.profile_name != profile_filename 
-                       and m.xml_filename != xml_filename]
+        if profile_filename in self._matched_profiles or xml_filename in self._matched_xmls:
+            kept = []
+            for m in self.matches:
+                if m.profile_name == profile_filename or m.xml_filename == xml_filename:
+                    self._matched_profiles.discard(m.profile_name)
+                    self._matched_xmls.discard(m.xml_filename)
+                else:
+                    kept.append(m)
+            self.matches = kept
         
         match = ProfileMatch(
             profile_name=profile_filename,
             xml_filename=xml_filename
         )
         self.matches.append(match)
+        self._matched_profiles.add(profile_filename)
+        self._matched_xmls.add(xml_filename)
         self._save_matches()
         
         return match
     
+    def bulk_create_matches(self, pairs: Sequence[Tuple[str, str]]) -> List[ProfileMatch]:
+        """
+        Create several matches at once, saving matches.json a single time.
+        
+        Same result as calling create_match for each pair in order.
+        
+        Args:
+            pairs: (profile_filename, xml_filename) tuples
+            
+        Returns:
+            Created ProfileMatch objects
+        """
+        # A pair survives only if no later pair reuses its profile or XML
+        later_profiles = set()
+        later_xmls = set()
+        created = []
+        for profile_filename, xml_filename in reversed(pairs):
+            if profile_filename not in later_profiles and xml_filename not in later_xmls:
+                created.append(ProfileMatch(profile_name=profile_filename,
+                                            xml_filename=xml_filename))
+            later_profiles.add(profile_filename)
+            later_xmls.add(xml_filename)
+        created.reverse()
+        
+        self.matches = [m for m in self.matches
+                        if m.profile_name not in later_profiles
+                        and m.xml_filename not in later_xmls]
+        self.matches.extend(created)
+        self._reindex_matches()
+        self._save_matches()
+        
+        return created
+    
     def remove_match(self, profile_filename: str) -> bool:
         """Remove a match by profile filename"""
-        initial_count = len(self.matches)
-        self.matches = [m for m in self.matches if m.profile_name != profile_filename]
-        
-        if len(self.matches) < initial_count:
+        if self._drop_profile_matches(profile_filename):
             self._save_matches()
             return True
         return False
     
+    def is_profile_matched(self, profile_filename: str) -> bool:
+        """Whether a profile has a match (O(1), no scan of matches)"""
+        return profile_filename in self._matched_profiles
+    
+    def is_xml_matched(self, xml_filename: str) -> bool:
+        """Whether an XML file has a match (O(1), no scan of matches)"""
+        return xml_filename in self._matched_xmls
+    
     def get_match_for_profile(self, profile_filename: str) -> Optional[ProfileMatch]:
         """Get match for a profile"""
+        if profile_filename not in self._matched_profiles:
+            return None
         for match in self.matches:
             if match.profile_name == profile_filename:
                 return match
@@ -537,6 +883,8 @@ class SessionManager:
     
     def get_match_for_xml(self, xml_filename: str) -> Optional[ProfileMatch]:
         """Get match for an XML file"""
+        if xml_filename not in self._matched_xmls:
+            return None
         for match in self.matches:
             if match.xml_filename == xml_filename:
                 return match
@@ -544,51 +892,97 @@ class SessionManager:
     
     def get_unmatched_profiles(self) -> List[Dict[str, Any]]:
         """Get profiles that are not matched"""
-        all_profiles = self.list_profiles()
-        matched_names = {m.profile_name for m in self.matches}
-        return [p for p in all_profiles if p['filename'] not in matched_names]
+        matched_names = self._matched_profiles
+        return [p for p in self.list_profiles() if p['filename'] not in matched_names]
     
     def get_unmatched_xmls(self) -> List[Dict[str, Any]]:
         """Get XMLs that are not matched"""
-        all_xmls = self.list_xmls()
-        matched_names = {m.xml_filename for m in self.matches}
-        return [x for x in all_xmls if x['filename'] not in matched_names]
+        matched_names = self._matched_xmls
+        return [x for x in self.list_xmls() if x['filename'] not in matched_names]
     
     def mark_as_exported(self, profile_filename: str):
         """Mark a match as exported"""
+        self.mark_many_as_exported([profile_filename])
+    
+    def mark_many_as_exported(self, profile_filenames: Iterable[str]):
+        """
+        Mark the matches of several profiles as exported.
+        
+        Args:
+            profile_filenames: Profile filenames; matches.json is written once
+        """
+        pending = set(profile_filenames)
+        if not pending:
+            return
         for match in self.matches:
-            if match.profile_name == profile_filename:
+            if match.profile_name in pending:
                 match.exported = True
-                self._save_matches()
-                break
+                pending.discard(match.profile_name)
+                if not pending:
+                    break
+        self._save_matches()
     
     # ==================== OUTPUT OPERATIONS ====================
     
+    def _current_output_dir(self) -> Path:
+        with self._lock:
+            if not self.current_session_path:
+                raise ValueError("No session loaded")
+            return self._output_dir
+    
     def get_output_dir(self) -> Optional[str]:
         """Get output directory path"""
         if not self.current_session_path:
             return None
-        return str(self.current_session_path / self.OUTPUT_DIR)
+        return str(self._output_dir)
     
-    def save_output(self, filename: str, data: Dict[str, Any]) -> str:
+    def save_output(self, filename: str, data: Optional[Dict[str, Any]] = None, *,
+                    raw_bytes: Optional[bytes] = None, output_dir: Optional[Path] = None) -> str:
         """
         Save output JSON to session output folder.
         
         Args:
             filename: Output filename
             data: Data to save
+            raw_bytes: Already-encoded JSON to write instead of data
+            output_dir: Output folder of a captured session, background
+                exports pass it so a session switch can't redirect them
             
         Returns:
             Full path to saved file
         """
-        if not self.current_session_path:
-            raise ValueError("No session loaded")
+        if output_dir is None:
+            output_dir = self._current_output_dir()
         
-        output_dir = self.current_session_path / self.OUTPUT_DIR
         output_dir.mkdir(exist_ok=True)
         
         filepath = output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        if raw_bytes is None:
+            raw_bytes = dumps_json(data)
+        _atomic_write_bytes(filepath, raw_bytes)
+        
+        return str(filepath)
+    
+    def save_error_log(self, errors: Sequence[Tuple[str, str]],
+                       filename: str = "export_errors.log",
+                       output_dir: Optional[Path] = None) -> str:
+        """
+        Write (name, message) error pairs to a log in the output folder.
+        
+        Args:
+            errors: (profile name, error message) pairs
+            filename: Log filename
+            output_dir: Output folder of a captured session
+            
+        Returns:
+            Full path to the log file
+        """
+        if output_dir is None:
+            output_dir = self._current_output_dir()
+        
+        output_dir.mkdir(exist_ok=True)
         
+        filepath = output_dir / filename
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.writelines(f"{name}: {message}\n" for name, message in errors)
         return str(filepath)
@@ -3,7 +3,7 @@ Pydantic models for data validation.
 Handles robust validation for dates, times, emails, and numeric ranges.
 """
 from typing import Optional, Dict, Any, List, Union
-from pydantic import BaseModel, Field, field_validator, EmailStr, model_validator
+from pydantic import BaseModel, Field, field_validator, model_validator, TypeAdapter
 from datetime import datetime
 import re
 
@@ -160,7 +160,7 @@ class SpO2(BaseModel):
 class ProfileFormModel(BaseModel):
     """Main validation model for the Profile Form"""
     
-    email: EmailStr
+    email: str
     consentements: ConsentData = Field(default_factory=ConsentData)
     identity: IdentityData = Field(default_factory=IdentityData)
     body_composition: BodyComposition = Field(default_factory=BodyComposition)
@@ -185,4 +185,15 @@ class ProfileFormModel(BaseModel):
     @field_validator('email')
     @classmethod
     def lower_email(cls, v):
-        return v.lower()
+        # Same check as EmailStr, email-validator is only imported on first use
+        from pydantic.networks import validate_email
+        return validate_email(v)[1].lower()
+
+
+# Built once at import; reused for every form validation
+_PROFILE_ADAPTER = TypeAdapter(ProfileFormModel)
+
+
+def validate_profile_dict(data: Dict[str, Any]) -> ProfileFormModel:
+    """Validate structured profile data (raises pydantic.ValidationError)"""
+    return _PROFILE_ADAPTER.validate_python(data)
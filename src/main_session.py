@@ -4,27 +4,49 @@ Tab-based UI with Sessions, Profiles, and XML Matching
 """
 import os
 import sys
+import threading
+import multiprocessing
+from itertools import count
+from functools import cached_property, partial
 import customtkinter as ctk
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import tkinter as tk
 from tkinter import filedialog, messagebox
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
-from utils.xml_parser import TCPXmlParser
-from core.data_transformer import DataTransformer
+from utils.xml_parser import clear_parse_cache
 from utils.json_exporter import JsonExporter
-from core.session_manager import SessionManager
+from core.session_manager import SessionManager, SessionSnapshot, profile_display_name
 from core.mongo_service import MongoService
 from core.protocol_store import ProtocolStore
-from ui.app_tabs import SessionListItem, ProfileListItem, XmlListItem, MatchListItem
+from core.export_worker import parse_and_transform
+from ui.app_tabs import SessionListItem, ProfileListItem, XmlListItem, MatchListItem, reconcile_items, batched_items
 from config import APP_NAME, APP_VERSION, SIDEBAR_COLORS, SIDEBAR_WIDTH
 
 # Import TabbedInputForm (3 tabs: Profil/Perso, Mesures Test, Analyse)
 from ui.tabbed_form import TabbedInputForm
+from ui.fonts import get_font
+from ui.toast import show_toast
 
 # Set appearance
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Sidebar page names (also their nav button labels)
+_PAGE_SESSIONS = "Sessions"
+_PAGE_PROFILES = "Profils"
+_PAGE_XML_MATCHING = "XML Matching"
+
+
+def _call_on_tk(widget, callback, *args):
+    """after(0, ...) from a worker thread, dropped if the window is already gone"""
+    try:
+        widget.after(0, callback, *args)
+    except (RuntimeError, tk.TclError):
+        pass
+
 
 class SessionTab(ctk.CTkFrame):
     """Tab for managing sessions"""
@@ -33,14 +55,17 @@ class SessionTab(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self.session_manager = session_manager
         self.on_session_loaded = on_session_loaded
-        self.session_items: List[SessionListItem] = []
+        self.session_items: Dict[str, SessionListItem] = {}
         self.selected_item: Optional[SessionListItem] = None
+        # Created on first use, then hidden/shown again
+        self._new_dialog: Optional[NewSessionDialog] = None
         
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
         
         self._create_ui()
-        self._refresh_sessions()
+        # List the sessions once the window is up, startup doesn't wait on the scan
+        self.after_idle(self._refresh_sessions)
     
     def _create_ui(self):
         # Header with buttons
@@ -48,7 +73,7 @@ class SessionTab(ctk.CTkFrame):
         header.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         header.grid_columnconfigure(1, weight=1)
         
-        title = ctk.CTkLabel(header, text="Sessions", font=ctk.CTkFont(size=18, weight="bold"))
+        title = ctk.CTkLabel(header, text="Sessions", font=get_font(18, "bold"))
         title.grid(row=0, column=0, sticky="w")
         
         btn_frame = ctk.CTkFrame(header, fg_color="transparent")
@@ -74,20 +99,18 @@ class SessionTab(ctk.CTkFrame):
         self.info_frame.grid(row=2, column=0, sticky="ew", padx=10, pady=10)
         
         self.session_label = ctk.CTkLabel(self.info_frame, text="Aucune session active",
-                                          font=ctk.CTkFont(size=14, weight="bold"))
+                                          font=get_font(14, "bold"))
         self.session_label.grid(row=0, column=0, padx=15, pady=10)
     
     def _refresh_sessions(self):
-        for item in self.session_items:
-            item.destroy()
-        self.session_items.clear()
+        if self.selected_item:
+            self.selected_item.set_selected(False)
         self.selected_item = None
         
         sessions = self.session_manager.list_sessions()
-        for session_info in sessions:
-            item = SessionListItem(self.session_list, session_info, on_select=self._on_select)
-            item.grid(sticky="ew", pady=2)
-            self.session_items.append(item)
+        self.session_items = reconcile_items(
+            self.session_items, sessions, 'path',
+            lambda info: SessionListItem(self.session_list, info, on_select=self._on_select))
         
         self._update_buttons()
         self._update_current_session_info()
@@ -112,8 +135,12 @@ class SessionTab(ctk.CTkFrame):
             self.session_label.configure(text="Aucune session active")
     
     def _new_session(self):
-        dialog = NewSessionDialog(self)
-        self.wait_window(dialog)
+        dialog = self._new_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = self._new_dialog = NewSessionDialog(self)
+        else:
+            dialog.show()
+        dialog.wait_closed()
         
         if dialog.result:
             try:
@@ -125,7 +152,7 @@ class SessionTab(ctk.CTkFrame):
                 self._refresh_sessions()
                 if self.on_session_loaded:
                     self.on_session_loaded()
-                messagebox.showinfo("Succès", "Session créée avec succès!")
+                show_toast(self, "Session créée avec succès!")
             except Exception as e:
                 messagebox.showerror("Erreur", f"Erreur lors de la création: {e}")
     
@@ -138,7 +165,7 @@ class SessionTab(ctk.CTkFrame):
             self._update_current_session_info()
             if self.on_session_loaded:
                 self.on_session_loaded()
-            messagebox.showinfo("Succès", "Session chargée!")
+            show_toast(self, "Session chargée!")
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur: {e}")
     
@@ -156,25 +183,29 @@ class SessionTab(ctk.CTkFrame):
 
 
 class NewSessionDialog(ctk.CTkToplevel):
-    """Dialog for creating a new session"""
+    """
+    Dialog for creating a new session.
+    
+    Built once and hidden on close; the owner calls show() then
+    wait_closed() for each new session.
+    """
     
     def __init__(self, parent):
         super().__init__(parent)
         self.result = None
+        # Set on Créer/Annuler/window close, wait_closed() waits on it
+        self._closed = tk.BooleanVar(self, value=False)
         
         self.title("Nouvelle Session")
         self.geometry("400x250")
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._close)
         
         # Form
         ctk.CTkLabel(self, text="Date (YYYY-MM-DD):").grid(row=0, column=0, padx=20, pady=10, sticky="w")
         self.date_entry = ctk.CTkEntry(self, width=200)
         self.date_entry.grid(row=0, column=1, padx=20, pady=10)
         
-        from datetime import datetime
-        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
-        
         ctk.CTkLabel(self, text="Lieu:").grid(row=1, column=0, padx=20, pady=10, sticky="w")
         self.location_entry = ctk.CTkEntry(self, width=200)
         self.location_entry.grid(row=1, column=1, padx=20, pady=10)
@@ -188,7 +219,36 @@ class NewSessionDialog(ctk.CTkToplevel):
         btn_frame.grid(row=3, column=0, columnspan=2, pady=20)
         
         ctk.CTkButton(btn_frame, text="Créer", command=self._create).grid(row=0, column=0, padx=10)
-        ctk.CTkButton(btn_frame, text="Annuler", fg_color="gray", command=self.destroy).grid(row=0, column=1, padx=10)
+        ctk.CTkButton(btn_frame, text="Annuler", fg_color="gray", command=self._close).grid(row=0, column=1, padx=10)
+        
+        self.reset()
+        self.grab_set()
+    
+    def reset(self):
+        """Empty the form (date back to today) and forget the last result"""
+        from datetime import datetime
+        self.result = None
+        self._closed.set(False)
+        for entry in (self.date_entry, self.location_entry, self.desc_entry):
+            entry.delete(0, "end")
+        self.date_entry.insert(0, datetime.now().strftime("%Y-%m-%d"))
+    
+    def show(self):
+        """Reset and bring the hidden dialog back"""
+        self.reset()
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+    
+    def wait_closed(self):
+        """Block (running the event loop) until the dialog is closed"""
+        if not self._closed.get():
+            self.wait_variable(self._closed)
+    
+    def _close(self):
+        self.grab_release()
+        self.withdraw()
+        self._closed.set(True)
     
     def _create(self):
         date = self.date_entry.get().strip()
@@ -203,7 +263,7 @@ class NewSessionDialog(ctk.CTkToplevel):
             'location': location,
             'description': self.desc_entry.get().strip()
         }
-        self.destroy()
+        self._close()
 
 
 class ProfileTab(ctk.CTkFrame):
@@ -214,10 +274,15 @@ class ProfileTab(ctk.CTkFrame):
         self.session_manager = session_manager
         self.mongo_service = mongo_service
         self.protocol_store = protocol_store
-        self.profile_items: List[ProfileListItem] = []
-        self.selected_item: Optional[ProfileListItem] = None
+        self.profile_items: Dict[str, ProfileListItem] = {}
+        # Single source of truth for the selection, items repaint from it
         self.current_filename: Optional[str] = None
         
+        # DB lookups run off the Tk thread, only the latest one is applied
+        self._lookup_pool = ThreadPoolExecutor(max_workers=1)
+        self._lookup_future: Optional[Future] = None
+        self._closed = False
+        
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
         
@@ -234,7 +299,7 @@ class ProfileTab(ctk.CTkFrame):
         header = ctk.CTkFrame(left_panel, fg_color="transparent")
         header.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         
-        ctk.CTkLabel(header, text="Profils", font=ctk.CTkFont(size=14, weight="bold")).grid(row=0, column=0)
+        ctk.CTkLabel(header, text="Profils", font=get_font(14, "bold")).grid(row=0, column=0)
         
         self.new_btn = ctk.CTkButton(header, text="+", width=30, command=self._new_profile)
         self.new_btn.grid(row=0, column=1, padx=5)
@@ -260,7 +325,7 @@ class ProfileTab(ctk.CTkFrame):
         form_header.grid_columnconfigure(0, weight=1)
         
         self.form_title = ctk.CTkLabel(form_header, text="Sélectionnez un profil",
-                                       font=ctk.CTkFont(size=16, weight="bold"))
+                                       font=get_font(16, "bold"))
         self.form_title.grid(row=0, column=0, sticky="w")
         
         self.save_btn = ctk.CTkButton(form_header, text="Sauvegarder", command=self._save_profile, state="disabled")
@@ -272,59 +337,49 @@ class ProfileTab(ctk.CTkFrame):
     
     def refresh(self):
         """Refresh profile list"""
-        for item in self.profile_items:
-            item.destroy()
-        self.profile_items.clear()
-        self.selected_item = None
-        self.current_filename = None
+        with batched_items(self.profile_items.values()):
+            self._select(None)
+            self._sync_profile_items()
         
         if not self.session_manager.current_session:
             self.form_title.configure(text="Aucune session active")
             return
         
-        profiles = self.session_manager.list_profiles()
-        for profile_info in profiles:
-            # Check if matched
-            match = self.session_manager.get_match_for_profile(profile_info['filename'])
-            item = ProfileListItem(self.profile_list, profile_info, on_select=self._on_select)
-            item.set_matched(match is not None)
-            item.grid(sticky="ew", pady=2)
-            self.profile_items.append(item)
-        
         self.form.clear()
         self.form_title.configure(text="Sélectionnez un profil")
         self._update_buttons()
     
+    def _sync_profile_items(self):
+        """Reconcile list widgets with the session's profiles and matches"""
+        if self.session_manager.current_session:
+            profiles = self.session_manager.list_profiles()
+        else:
+            profiles = []
+        self.profile_items = reconcile_items(
+            self.profile_items, profiles, 'filename',
+            lambda info: ProfileListItem(self.profile_list, info, on_select=self._on_select))
+        
+        is_matched = self.session_manager.is_profile_matched
+        for filename, item in self.profile_items.items():
+            item.set_matched(is_matched(filename))
+    
+    def _select(self, filename: Optional[str]):
+        """Move the selection, repainting only the previous and new items"""
+        previous, self.current_filename = self.current_filename, filename
+        for key in {previous, filename}:
+            item = self.profile_items.get(key)
+            if item is not None:
+                item.refresh_selected(filename)
+    
     def _on_select(self, item: ProfileListItem):
-        # Deselect previous item (only if widget still exists)
-        if self.selected_item:
-            try:
-                if self.selected_item.winfo_exists():
-                    self.selected_item.set_selected(False)
-            except Exception:
-                pass  # Widget was destroyed, ignore
-        
-        self.selected_item = item
-        self.current_filename = item.profile_info.get('filename')
-        
-        # Check if clicked item still exists
-        try:
-            if not item.winfo_exists():
-                return
-            item.set_selected(True)
-        except Exception:
-            return
+        self._select(item.profile_info.get('filename'))
         
         # Load profile data
         data = self.session_manager.get_profile(self.current_filename)
         if data:
             self.form.set_data(data)
-            # Safely get name (handle None values)
-            identity = data.get('identity') or {}
-            last_name = (identity.get('last_name') or '').strip()
-            first_name = (identity.get('first_name') or '').strip()
-            name = f"{last_name} {first_name}".strip()
-            self.form_title.configure(text=name or "Nouveau profil")
+            self.form_title.configure(
+                text=profile_display_name(data.get('identity')) or "Nouveau profil")
         else:
             self.form.clear()
             self.form_title.configure(text="Profil non trouvé")
@@ -332,7 +387,7 @@ class ProfileTab(ctk.CTkFrame):
         self._update_buttons()
     
     def _update_buttons(self):
-        state = "normal" if self.selected_item else "disabled"
+        state = "normal" if self.current_filename else "disabled"
         self.save_btn.configure(state=state)
         self.delete_btn.configure(state=state)
     
@@ -350,13 +405,12 @@ class ProfileTab(ctk.CTkFrame):
         
         try:
             filename = self.session_manager.add_profile(empty)
-            self.refresh()
+            self._refresh_profile_list()
             
             # Select the new profile
-            for item in self.profile_items:
-                if item.profile_info.get('filename') == filename:
-                    self._on_select(item)
-                    break
+            item = self.profile_items.get(filename)
+            if item:
+                self._on_select(item)
         except Exception as e:
             messagebox.showerror("Erreur", f"Erreur: {e}")
     
@@ -372,11 +426,9 @@ class ProfileTab(ctk.CTkFrame):
             return
 
         # Check if file still exists (might have been deleted)
-        profile_exists = self.session_manager.get_profile(self.current_filename) is not None
-        if not profile_exists:
+        if not self.session_manager.profile_exists(self.current_filename):
             if not silent:
                 messagebox.showwarning("Attention", "Ce profil n'existe plus. Rafraîchissement...")
-            self.current_filename = None
             self.refresh()
             return
         
@@ -385,6 +437,10 @@ class ProfileTab(ctk.CTkFrame):
             # update_profile now returns new filename (may be renamed)
             new_filename = self.session_manager.update_profile(self.current_filename, data)
             if new_filename:
+                # Next lookup for this email should see fresh DB data
+                if not silent and self.mongo_service and data.get('email'):
+                    self.mongo_service.invalidate_email_cache(data['email'])
+
                 # Update current filename if it was renamed
                 self.current_filename = new_filename
                 
@@ -393,11 +449,8 @@ class ProfileTab(ctk.CTkFrame):
                     self.after(1500, lambda: self.save_btn.configure(text="Sauvegarder"))
                     
                     # Update the form title with the new name
-                    identity = data.get('identity') or {}
-                    last_name = (identity.get('last_name') or '').strip()
-                    first_name = (identity.get('first_name') or '').strip()
-                    name = f"{last_name} {first_name}".strip()
-                    self.form_title.configure(text=name or "Nouveau profil")
+                    self.form_title.configure(
+                        text=profile_display_name(data.get('identity')) or "Nouveau profil")
                     
                     # Only refresh the profile list on explicit save (not silent)
                     # to avoid destroying widgets during click handlers
@@ -410,28 +463,13 @@ class ProfileTab(ctk.CTkFrame):
     
     def _refresh_profile_list(self):
         """Refresh profile list while keeping current selection"""
-        saved_filename = self.current_filename
-        
-        # Clear and rebuild list
-        for item in self.profile_items:
-            item.destroy()
-        self.profile_items.clear()
-        
-        if not self.session_manager.current_session:
-            return
-        
-        profiles = self.session_manager.list_profiles()
-        for profile_info in profiles:
-            match = self.session_manager.get_match_for_profile(profile_info['filename'])
-            item = ProfileListItem(self.profile_list, profile_info, on_select=self._on_select)
-            item.set_matched(match is not None)
-            item.grid(sticky="ew", pady=2)
-            self.profile_items.append(item)
+        with batched_items(self.profile_items.values()):
+            self._sync_profile_items()
             
-            # Re-select the previously selected item
-            if profile_info.get('filename') == saved_filename:
-                self.selected_item = item
-                item.set_selected(True)
+            # Re-select the current profile (new widget if it was renamed)
+            item = self.profile_items.get(self.current_filename)
+            if item:
+                item.refresh_selected(self.current_filename)
     
     def _delete_profile(self):
         if not self.current_filename:
@@ -440,7 +478,6 @@ class ProfileTab(ctk.CTkFrame):
             return
         
         self.session_manager.delete_profile(self.current_filename)
-        self.current_filename = None
         self.refresh()
 
     # ------------------------------------------------------------------ #
@@ -456,9 +493,32 @@ class ProfileTab(ctk.CTkFrame):
             return
 
         self.form.set_db_status("Recherche en cours...", color="gray")
-        self.update_idletasks()  # Force UI refresh
 
-        user = self.mongo_service.find_user_by_email(email)
+        # Last click wins: a queued lookup is dropped, a running one ignored
+        if self._closed:
+            return
+        if self._lookup_future:
+            self._lookup_future.cancel()
+        filename = self.current_filename
+        future = self._lookup_pool.submit(self.mongo_service.find_user_by_email, email)
+        self._lookup_future = future
+        future.add_done_callback(
+            lambda f: _call_on_tk(self, self._apply_db_result, email, filename, f))
+
+    def shutdown(self):
+        """Stop the lookup thread when the window closes"""
+        self._closed = True
+        self._lookup_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _apply_db_result(self, email: str, filename: Optional[str], future: Future):
+        """Merge a finished lookup into the form, unless it went stale"""
+        if future.cancelled() or future is not self._lookup_future:
+            return
+        self._lookup_future = None
+        if self.current_filename != filename:
+            return
+
+        user = future.exception() is None and future.result()
         if user:
             # Convert DB doc to profile format
             db_profile = MongoService.db_user_to_profile(user)
@@ -482,16 +542,20 @@ class XmlMatchTab(ctk.CTkFrame):
         super().__init__(master, **kwargs)
         self.session_manager = session_manager
         self.mongo_service = mongo_service
-        self.parser = TCPXmlParser()
-        self.transformer = DataTransformer()
-        self.exporter = JsonExporter()
         
-        self.xml_items: List[XmlListItem] = []
-        self.profile_items: List[ProfileListItem] = []
-        self.match_items: List[MatchListItem] = []
+        # Parse/transform/export jobs run here, results come back via after()
+        self._io_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+        self._exports_in_flight: set = set()
+        # Set by shutdown(), background work must not start pools after it
+        self._closed = False
+        
+        self.xml_items: Dict[str, XmlListItem] = {}
+        self.profile_items: Dict[str, ProfileListItem] = {}
+        self.match_items: Dict[str, MatchListItem] = {}
         
-        self.selected_xml: Optional[XmlListItem] = None
-        self.selected_profile: Optional[ProfileListItem] = None
+        # Selected filenames, items repaint from these
+        self.selected_xml: Optional[str] = None
+        self.selected_profile: Optional[str] = None
         
         self.grid_columnconfigure(0, weight=1)
         self.grid_columnconfigure(1, weight=1)
@@ -511,8 +575,9 @@ class XmlMatchTab(ctk.CTkFrame):
         xml_header = ctk.CTkFrame(xml_panel, fg_color="transparent")
         xml_header.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         
-        ctk.CTkLabel(xml_header, text="Fichiers XML", font=ctk.CTkFont(size=14, weight="bold")).grid(row=0, column=0)
-        ctk.CTkButton(xml_header, text="Importer", width=80, command=self._import_xmls).grid(row=0, column=1, padx=5)
+        ctk.CTkLabel(xml_header, text="Fichiers XML", font=get_font(14, "bold")).grid(row=0, column=0)
+        self.import_btn = ctk.CTkButton(xml_header, text="Importer", width=80, command=self._import_xmls)
+        self.import_btn.grid(row=0, column=1, padx=5)
         
         self.xml_list = ctk.CTkScrollableFrame(xml_panel)
         self.xml_list.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
@@ -527,7 +592,7 @@ class XmlMatchTab(ctk.CTkFrame):
         action_frame.place(relx=0.5, rely=0.3, anchor="center")
         
         self.match_btn = ctk.CTkButton(action_frame, text="Matcher", width=120, height=40,
-                                       font=ctk.CTkFont(size=14), command=self._create_match, state="disabled")
+                                       font=get_font(14), command=self._create_match, state="disabled")
         self.match_btn.grid(row=0, column=0, pady=10)
         
         ctk.CTkLabel(action_frame, text="Sélectionnez un XML\net un profil", 
@@ -543,7 +608,7 @@ class XmlMatchTab(ctk.CTkFrame):
         profile_header = ctk.CTkFrame(profile_panel, fg_color="transparent")
         profile_header.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         
-        ctk.CTkLabel(profile_header, text="Profils", font=ctk.CTkFont(size=14, weight="bold")).grid(row=0, column=0)
+        ctk.CTkLabel(profile_header, text="Profils", font=get_font(14, "bold")).grid(row=0, column=0)
         ctk.CTkButton(profile_header, text="Refresh", width=60, command=self.refresh).grid(row=0, column=1, padx=5)
         
         self.profile_list = ctk.CTkScrollableFrame(profile_panel)
@@ -560,7 +625,7 @@ class XmlMatchTab(ctk.CTkFrame):
         match_header.grid(row=0, column=0, sticky="ew", padx=5, pady=5)
         match_header.grid_columnconfigure(0, weight=1)
         
-        ctk.CTkLabel(match_header, text="Associations", font=ctk.CTkFont(size=14, weight="bold")).grid(
+        ctk.CTkLabel(match_header, text="Associations", font=get_font(14, "bold")).grid(
             row=0, column=0, padx=5, sticky="w")
         
         self.export_all_btn = ctk.CTkButton(
@@ -576,70 +641,72 @@ class XmlMatchTab(ctk.CTkFrame):
     
     def refresh(self):
         """Refresh all lists"""
-        self._refresh_xmls()
-        self._refresh_profiles()
-        self._refresh_matches()
+        with batched_items([*self.xml_items.values(), *self.profile_items.values()]):
+            self._refresh_xmls()
+            self._refresh_profiles()
+            self._refresh_matches()
     
     def _refresh_xmls(self):
-        for item in self.xml_items:
-            item.destroy()
-        self.xml_items.clear()
-        self.selected_xml = None
+        self._select_xml(None)
         
-        if not self.session_manager.current_session:
-            return
+        has_session = self.session_manager.current_session is not None
+        xmls = self.session_manager.list_xmls() if has_session else []
+        self.xml_items = reconcile_items(
+            self.xml_items, xmls, 'filename',
+            lambda info: XmlListItem(self.xml_list, info, on_select=self._on_xml_select))
         
-        xmls = self.session_manager.list_xmls()
-        for xml_info in xmls:
-            match = self.session_manager.get_match_for_xml(xml_info['filename'])
-            item = XmlListItem(self.xml_list, xml_info, on_select=self._on_xml_select)
-            item.set_matched(match is not None)
-            item.grid(sticky="ew", pady=2)
-            self.xml_items.append(item)
+        is_matched = self.session_manager.is_xml_matched
+        for filename, item in self.xml_items.items():
+            item.set_matched(is_matched(filename))
     
     def _refresh_profiles(self):
-        for item in self.profile_items:
-            item.destroy()
-        self.profile_items.clear()
-        self.selected_profile = None
+        self._select_profile(None)
         
-        if not self.session_manager.current_session:
-            return
+        has_session = self.session_manager.current_session is not None
+        profiles = self.session_manager.list_profiles() if has_session else []
+        self.profile_items = reconcile_items(
+            self.profile_items, profiles, 'filename',
+            lambda info: ProfileListItem(self.profile_list, info, on_select=self._on_profile_select))
         
-        profiles = self.session_manager.list_profiles()
-        for profile_info in profiles:
-            match = self.session_manager.get_match_for_profile(profile_info['filename'])
-            item = ProfileListItem(self.profile_list, profile_info, on_select=self._on_profile_select)
-            item.set_matched(match is not None)
-            item.grid(sticky="ew", pady=2)
-            self.profile_items.append(item)
+        is_matched = self.session_manager.is_profile_matched
+        for filename, item in self.profile_items.items():
+            item.set_matched(is_matched(filename))
+    
+    def _create_match_item(self, match_info: Dict) -> MatchListItem:
+        item = MatchListItem(self.match_list, match_info,
+                             on_export=self._export_match, on_remove=self._remove_match)
+        if match_info['profile_name'] in self._exports_in_flight:
+            item.export_btn.configure(state="disabled")
+        return item
     
     def _refresh_matches(self):
-        for item in self.match_items:
-            item.destroy()
-        self.match_items.clear()
-        
-        if not self.session_manager.current_session:
-            return
-        
-        for match in self.session_manager.matches:
-            item = MatchListItem(self.match_list, match.to_dict(),
-                               on_export=self._export_match, on_remove=self._remove_match)
-            item.grid(sticky="ew", pady=2)
-            self.match_items.append(item)
+        if self.session_manager.current_session:
+            infos = [m.to_dict() for m in self.session_manager.matches]
+        else:
+            infos = []
+        self.match_items = reconcile_items(self.match_items, infos, 'profile_name',
+                                           self._create_match_item)
+    
+    def _select_xml(self, filename: Optional[str]):
+        previous, self.selected_xml = self.selected_xml, filename
+        for key in {previous, filename}:
+            item = self.xml_items.get(key)
+            if item is not None:
+                item.refresh_selected(filename)
+    
+    def _select_profile(self, filename: Optional[str]):
+        previous, self.selected_profile = self.selected_profile, filename
+        for key in {previous, filename}:
+            item = self.profile_items.get(key)
+            if item is not None:
+                item.refresh_selected(filename)
     
     def _on_xml_select(self, item: XmlListItem):
-        if self.selected_xml:
-            self.selected_xml.set_selected(False)
-        self.selected_xml = item
-        item.set_selected(True)
+        self._select_xml(item.xml_info.get('filename'))
         self._update_match_button()
     
     def _on_profile_select(self, item: ProfileListItem):
-        if self.selected_profile:
-            self.selected_profile.set_selected(False)
-        self.selected_profile = item
-        item.set_selected(True)
+        self._select_profile(item.profile_info.get('filename'))
         self._update_match_button()
     
     def _update_match_button(self):
@@ -663,88 +730,236 @@ class XmlMatchTab(ctk.CTkFrame):
             return
         
         files_to_import = []
+        folder = None
         
         if choice:  # Yes = folder
+            # Listed on the import thread, a network folder may be slow
             folder = filedialog.askdirectory(title="Sélectionner un dossier contenant des XMLs")
-            if folder:
-                from pathlib import Path
-                folder_path = Path(folder)
-                files_to_import = list(folder_path.glob("*.xml"))
+            if not folder:
+                return
         else:  # No = individual files
             files = filedialog.askopenfilenames(
                 title="Sélectionner des fichiers XML",
                 filetypes=[("XML files", "*.xml"), ("All files", "*.*")]
             )
             files_to_import = list(files) if files else []
+            if not files_to_import:
+                return
         
-        if not files_to_import:
+        # Copy into this session even if the user opens another meanwhile
+        session = self.session_manager.snapshot()
+        self.import_btn.configure(state="disabled")
+        threading.Thread(target=self._run_import_xmls, args=(session, files_to_import, folder),
+                         daemon=True).start()
+    
+    @staticmethod
+    def _scan_xml_folder(folder: str) -> List[str]:
+        """Paths of the .xml files (any case) directly in folder"""
+        with os.scandir(folder) as entries:
+            return [entry.path for entry in entries
+                    if entry.name.lower().endswith('.xml') and entry.is_file()]
+    
+    def _run_import_xmls(self, session: SessionSnapshot, paths: List[str],
+                         folder: Optional[str] = None):
+        """Background thread: list/copy the XMLs (in parallel), then report on the Tk thread"""
+        try:
+            if folder:
+                paths = self._scan_xml_folder(folder)
+            results = self.session_manager.import_xmls_bulk(paths, session.xml_dir) if paths else []
+        except Exception as e:
+            results = [{'source': p, 'filename': None, 'error': str(e)} for p in paths or [folder]]
+        _call_on_tk(self, self._finish_import_xmls, session, results)
+    
+    def _finish_import_xmls(self, session: SessionSnapshot, results: List[Dict[str, Any]]):
+        """Main thread: refresh the XML list and show the import count"""
+        if not self.winfo_exists():
+            return
+        self.import_btn.configure(state="normal")
+        if not results:  # Empty folder
             return
         
-        imported = 0
-        for filepath in files_to_import:
-            try:
-                self.session_manager.import_xml(str(filepath))
-                imported += 1
-            except Exception as e:
-                print(f"Error importing {filepath}: {e}")
+        failed = [r for r in results if r['error']]
+        imported = len(results) - len(failed)
+        
+        self._clear_xml_cache()
+        moved_on = not self.session_manager.is_current(session)
+        if not moved_on:
+            self._refresh_xmls()
+        if not failed and not moved_on:
+            show_toast(self, f"{imported} fichier(s) importé(s)")
+            return
         
-        self._refresh_xmls()
-        messagebox.showinfo("Succès", f"{imported} fichier(s) importé(s)")
+        # Failures and a session change need to be seen, not just flashed
+        msg = f"{imported}/{len(results)} fichier(s) importé(s)."
+        if moved_on:
+            msg += f"\n\nLa session a changé pendant l'import, les fichiers sont dans:\n{session.xml_dir}"
+        if failed:
+            msg += "\n\nÉchecs:\n" + "\n".join(f"• {os.path.basename(r['source'])}: {r['error']}"
+                                                for r in failed[:self.MAX_LISTED_ERRORS])
+            if len(failed) > self.MAX_LISTED_ERRORS:
+                msg += f"\n… et {len(failed) - self.MAX_LISTED_ERRORS} autre(s)"
+            messagebox.showwarning("Import terminé", msg)
+        else:
+            messagebox.showinfo("Import terminé", msg)
     
     def _create_match(self):
         if not self.selected_xml or not self.selected_profile:
             return
         
-        xml_filename = self.selected_xml.xml_info.get('filename', '')
-        profile_filename = self.selected_profile.profile_info.get('filename', '')
-        
-        self.session_manager.create_match(profile_filename, xml_filename)
-        self.refresh()
+        self.session_manager.create_match(self.selected_profile, self.selected_xml)
+        self._refresh_match_state()
     
     def _remove_match(self, match_info: Dict):
         profile_name = match_info.get('profile_name', '')
         self.session_manager.remove_match(profile_name)
-        self.refresh()
+        self._refresh_match_state()
+    
+    def _refresh_match_state(self):
+        """
+        Update after a match change: re-flag the listed XMLs/profiles and
+        sync the match list, without rescanning the session folders.
+        """
+        sm = self.session_manager
+        self._select_xml(None)
+        self._select_profile(None)
+        # set_matched only redraws the items whose flag flipped
+        for filename, item in self.xml_items.items():
+            item.set_matched(sm.is_xml_matched(filename))
+        for filename, item in self.profile_items.items():
+            item.set_matched(sm.is_profile_matched(filename))
+        self._refresh_matches()
+        self._update_match_button()
+    
+    def _set_export_busy(self, profile_name: str, busy: bool):
+        """Track an in-flight export and toggle its match button"""
+        if busy:
+            self._exports_in_flight.add(profile_name)
+        else:
+            self._exports_in_flight.discard(profile_name)
+        item = self.match_items.get(profile_name)
+        if item:
+            item.export_btn.configure(state="disabled" if busy else "normal")
+    
+    # "Exporter tout" is mostly file I/O, so it may use more threads than cores
+    EXPORT_WORKERS = 16
+    # From this many matches, parse+transform runs in worker processes
+    PROCESS_EXPORT_MIN = 4
+    # Above this, "Exporter tout" errors go to export_errors.log
+    MAX_LISTED_ERRORS = 20
+    
+    @cached_property
+    def exporter(self) -> JsonExporter:
+        return JsonExporter()
+    
+    def _clear_xml_cache(self):
+        clear_parse_cache()
+    
+    @staticmethod
+    def _build_output_filename(identity: Dict[str, Any], date: str) -> str:
+        """Output JSON name: LASTNAME_Firstname_<session date>.json"""
+        name = f"{identity.get('last_name', 'Unknown')}_{identity.get('first_name', '')}".strip('_')
+        return f"{name}_{date}.json"
+    
+    def _export_one(self, session: SessionSnapshot, profile_name: str, xml_filename: str,
+                    xml_paths: Dict[str, str]) -> Tuple[bool, str]:
+        """
+        Export one match: load profile, parse XML, transform and save.
+        
+        Runs on worker threads, so it only uses a per-call parser and the
+        stateless shared transformer, and touches no widget.
+        
+        Args:
+            session: Session the export was started in, captured on the Tk
+                thread; its folders and date are used even if another one
+                is opened
+            xml_paths: {filename: path} of the session XMLs, resolved on the
+                Tk thread
+        
+        Returns:
+            (True, output path) or (False, error message)
+        """
+        try:
+            profile_data, xml_path, error = self._load_export_inputs(
+                session, profile_name, xml_filename, xml_paths)
+        except Exception as e:
+            return False, str(e)
+        if error:
+            return False, error
+        return self._export_loaded(session, profile_data, xml_path)
+    
+    def _export_loaded(self, session: SessionSnapshot, profile_data: Dict,
+                       xml_path: str) -> Tuple[bool, str]:
+        """Parse, transform and save a match whose inputs are already checked"""
+        try:
+            # Same step the worker processes run, here on the calling thread
+            output = parse_and_transform(xml_path, profile_data)
+            return True, self._save_export(session, profile_data, output)
+        except Exception as e:
+            return False, str(e)
+    
+    def _load_export_inputs(self, session: SessionSnapshot, profile_name: str, xml_filename: str,
+                            xml_paths: Dict[str, str]
+                            ) -> Tuple[Optional[Dict], Optional[str], str]:
+        """
+        Load and check what a match export needs, from the given session.
+        
+        Returns:
+            (profile data, XML path, "") or (None, None, error message)
+        """
+        profile_data = self.session_manager.get_profile(profile_name, session.profiles_dir)
+        if not profile_data:
+            return None, None, "profil non trouvé"
+        
+        if not profile_data.get('email'):
+            return None, None, "email manquant"
+        
+        xml_path = xml_paths.get(xml_filename)
+        if not xml_path:
+            return None, None, f"{xml_filename}: XML non trouvé"
+        
+        return profile_data, xml_path, ""
+    
+    def _save_export(self, session: SessionSnapshot, profile_data: Dict, output: Dict) -> str:
+        """Write a transformed output under its LASTNAME_Firstname_date name"""
+        output_filename = self._build_output_filename(profile_data.get('identity', {}), session.date)
+        return self.session_manager.save_output(output_filename, output,
+                                                output_dir=session.output_dir)
     
     def _export_match(self, match_info: Dict):
         profile_name = match_info.get('profile_name', '')
         xml_filename = match_info.get('xml_filename', '')
         
-        try:
-            # Get profile data
-            profile_data = self.session_manager.get_profile(profile_name)
-            if not profile_data:
-                messagebox.showerror("Erreur", "Profil non trouvé")
-                return
-            
-            if not profile_data.get('email'):
-                messagebox.showwarning("Attention", "L'email est requis dans le profil")
-                return
-            
-            # Parse XML
-            xml_path = self.session_manager.get_xml_path(xml_filename)
-            xml_data = self.parser.parse_file(xml_path)
-            
-            # Transform using existing transformer
-            output = self.transformer.transform(xml_data, profile_data)
-            
-            # Generate output filename
-            identity = profile_data.get('identity', {})
-            name = f"{identity.get('last_name', 'Unknown')}_{identity.get('first_name', '')}".strip('_')
-            date = self.session_manager.current_session.date
-            output_filename = f"{name}_{date}.json"
-            
-            # Save to session output folder
-            output_path = self.session_manager.save_output(output_filename, output)
-            
-            # Mark as exported
+        if profile_name in self._exports_in_flight:
+            return
+        
+        # Pin the export to this session, the user may open another meanwhile
+        session = self.session_manager.snapshot()
+        if session is None:
+            return
+        xml_path = self.session_manager.get_xml_path(xml_filename)
+        xml_paths = {xml_filename: xml_path} if xml_path else {}
+        
+        self._set_export_busy(profile_name, True)
+        future = self._io_pool.submit(self._export_one, session, profile_name, xml_filename, xml_paths)
+        future.add_done_callback(lambda f: _call_on_tk(self, self._on_export_done, session, profile_name, f))
+    
+    def _on_export_done(self, session: SessionSnapshot, profile_name: str, future: Future):
+        """Main thread: report a single export result"""
+        if not self.winfo_exists():
+            return
+        self._set_export_busy(profile_name, False)
+        
+        ok, detail = future.result()
+        if not ok:
+            messagebox.showerror("Erreur", f"Erreur lors de l'export: {detail}")
+            return
+        
+        # Mark as exported, unless another session was opened meanwhile
+        if self.session_manager.is_current(session):
             self.session_manager.mark_as_exported(profile_name)
             self._refresh_matches()
-            
-            messagebox.showinfo("Succès", f"Exporté vers:\n{output_path}")
-            
-        except Exception as e:
-            messagebox.showerror("Erreur", f"Erreur lors de l'export: {e}")
+        
+        show_toast(self, f"Exporté vers:\n{detail}")
 
     def _export_all_matches(self):
         """Export all matched profiles+XML at once."""
@@ -757,53 +972,188 @@ class XmlMatchTab(ctk.CTkFrame):
             messagebox.showinfo("Info", "Aucune association à exporter")
             return
         
-        success = 0
         errors = []
-        
+        pairs = []
+        in_flight = self._exports_in_flight
         for match in matches:
-            profile_name = match.profile_name
-            xml_filename = match.xml_filename
-            
-            try:
-                profile_data = self.session_manager.get_profile(profile_name)
-                if not profile_data:
-                    errors.append(f"{profile_name}: profil non trouvé")
-                    continue
-                
-                if not profile_data.get('email'):
-                    errors.append(f"{profile_name}: email manquant")
-                    continue
-                
-                xml_path = self.session_manager.get_xml_path(xml_filename)
-                if not xml_path:
-                    errors.append(f"{xml_filename}: XML non trouvé")
-                    continue
-                
-                xml_data = self.parser.parse_file(xml_path)
-                output = self.transformer.transform(xml_data, profile_data)
-                
-                identity = profile_data.get('identity', {})
-                name = f"{identity.get('last_name', 'Unknown')}_{identity.get('first_name', '')}".strip('_')
-                date = self.session_manager.current_session.date
-                output_filename = f"{name}_{date}.json"
-                
-                self.session_manager.save_output(output_filename, output)
-                self.session_manager.mark_as_exported(profile_name)
-                success += 1
+            if match.profile_name in in_flight:
+                errors.append((match.profile_name, "export déjà en cours"))
+            else:
+                pairs.append((match.profile_name, match.xml_filename))
+        
+        # Everything the batch reads or writes is pinned to this session
+        session = self.session_manager.snapshot()
+        xml_paths = self.session_manager.scan_xml_paths()
+        
+        self.export_all_btn.configure(state="disabled")
+        for profile_name, _ in pairs:
+            self._set_export_busy(profile_name, True)
+        threading.Thread(target=self._run_export_all,
+                         args=(session, xml_paths, pairs, len(matches), errors),
+                         daemon=True).start()
+    
+    def _run_export_all(self, session: SessionSnapshot, xml_paths: Dict[str, str],
+                        pairs: List[Tuple[str, str]], total: int,
+                        errors: List[Tuple[str, str]]):
+        """Background thread: export all pairs in parallel, then report on the Tk thread"""
+        results: List[Optional[Tuple[bool, str]]] = [None] * len(pairs)
+        failure = "export interrompu"
+        try:
+            if pairs:
+                # Cheap checks first, so only exportable matches reach the pools
+                jobs: List[Tuple[Dict, str]] = []
+                job_slots = []
+                load_inputs = partial(self._load_export_inputs, session)
+                for slot, (profile_name, xml_filename) in enumerate(pairs):
+                    try:
+                        profile_data, xml_path, error = load_inputs(profile_name, xml_filename, xml_paths)
+                    except Exception as e:
+                        error = str(e)
+                    if error:
+                        results[slot] = (False, error)
+                    else:
+                        job_slots.append(slot)
+                        jobs.append((profile_data, xml_path))
                 
+                if jobs:
+                    self._check_open()
+                    exported = None
+                    if len(jobs) >= self.PROCESS_EXPORT_MIN:
+                        exported = self._export_in_processes(session, jobs,
+                                                             self._progress_reporter(len(jobs)))
+                    if exported is None:
+                        self._check_open()
+                        export = partial(self._export_loaded, session)
+                        report = self._progress_reporter(len(jobs))
+                        
+                        def export_and_report(profile_data, xml_path):
+                            result = export(profile_data, xml_path)
+                            report()
+                            return result
+                        
+                        with ThreadPoolExecutor(max_workers=min(len(jobs), self.EXPORT_WORKERS)) as ex:
+                            exported = list(ex.map(export_and_report, *zip(*jobs)))
+                    for slot, result in zip(job_slots, exported):
+                        results[slot] = result
+        except Exception as e:
+            failure = str(e)
+        finally:
+            # Always report back, or the buttons would stay disabled for good
+            results = [result or (False, failure) for result in results]
+            _call_on_tk(self, self._finish_export_all, session, pairs, results, total, errors)
+    
+    def _progress_reporter(self, total: int):
+        """Callable for export workers, posts "done/total" to the Tk thread on each call"""
+        done = count(1)  # next() on a count is atomic in CPython
+        
+        def report():
+            _call_on_tk(self, self._show_export_progress, next(done), total)
+        return report
+    
+    def _show_export_progress(self, done: int, total: int):
+        if self.winfo_exists() and self.export_all_btn.cget("state") == "disabled":
+            self.export_all_btn.configure(text=f"Export {done}/{total}...")
+    
+    @cached_property
+    def _parse_pool(self) -> ProcessPoolExecutor:
+        # Kept until the window closes, worker start-up is paid once. Spawned,
+        # not forked: this process runs Tk and live thread pools
+        self._check_open()
+        return ProcessPoolExecutor(max_workers=os.cpu_count() or 1,
+                                   mp_context=multiprocessing.get_context("spawn"))
+    
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("fenêtre fermée")
+    
+    def _drop_parse_pool(self):
+        pool = self.__dict__.pop('_parse_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def shutdown(self):
+        """Stop the export threads and worker processes when the window closes"""
+        self._closed = True
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        self._drop_parse_pool()
+    
+    def _export_in_processes(self, session: SessionSnapshot, jobs: List[Tuple[Dict, str]],
+                             on_done=None) -> Optional[List[Tuple[bool, str]]]:
+        """
+        Export checked (profile data, XML path) jobs with parse+transform
+        (CPU bound) in worker processes.
+        
+        Outputs are written here, in this thread; only the picklable
+        parse_and_transform step crosses processes. on_done() is called
+        after each job.
+        
+        Returns:
+            Results as _export_loaded would give them, or None if the
+            process pool is unusable (caller falls back to threads)
+        """
+        futures = []
+        try:
+            submit = self._parse_pool.submit
+            for profile_data, xml_path in jobs:
+                futures.append(submit(parse_and_transform, xml_path, profile_data))
+        except (OSError, RuntimeError, BrokenProcessPool):
+            for future in futures:
+                future.cancel()
+            return None
+        
+        results: List[Tuple[bool, str]] = []
+        save_export = self._save_export
+        for (profile_data, _), future in zip(jobs, futures):
+            try:
+                results.append((True, save_export(session, profile_data, future.result())))
+            except BrokenProcessPool:
+                # A worker died (e.g. killed), redo the batch on threads
+                self._drop_parse_pool()
+                return None
             except Exception as e:
-                errors.append(f"{profile_name}: {e}")
+                results.append((False, str(e)))
+            if on_done is not None:
+                on_done()
+        return results
+    
+    def _finish_export_all(self, session: SessionSnapshot, pairs: List[Tuple[str, str]],
+                           results: List[Tuple[bool, str]], total: int,
+                           errors: List[Tuple[str, str]]):
+        """Main thread: mark exported matches and show the "Exporter tout" summary"""
+        if not self.winfo_exists():
+            return
         
-        self._refresh_matches()
+        exported_names = []
+        for (profile_name, _), (ok, detail) in zip(pairs, results):
+            self._set_export_busy(profile_name, False)
+            if ok:
+                exported_names.append(profile_name)
+            else:
+                errors.append((profile_name, detail))
+        success = len(exported_names)
+        self.export_all_btn.configure(state="normal", text="Exporter tout")
         
         # Show summary
-        msg = f"{success}/{len(matches)} exporté(s) avec succès."
-        if errors:
-            msg += "\n\nErreurs:\n" + "\n".join(f"• {e}" for e in errors)
+        msg = f"{success}/{total} exporté(s) avec succès."
+        if self.session_manager.is_current(session):
+            self.session_manager.mark_many_as_exported(exported_names)
+            self._refresh_matches()
+        else:
+            # matches.json of the current session doesn't hold these matches
+            msg += "\n\nLa session a changé pendant l'export, les associations ne sont pas marquées."
+        if len(errors) > self.MAX_LISTED_ERRORS:
+            # Too many to list in a dialog, hand them over as a log file
+            try:
+                log_path = self.session_manager.save_error_log(errors, output_dir=session.output_dir)
+                msg += f"\n\n{len(errors)} erreur(s) — voir {os.path.basename(log_path)}"
+            except (OSError, ValueError) as e:
+                msg += f"\n\n{len(errors)} erreur(s), journal non écrit: {e}"
+            messagebox.showwarning("Export terminé", msg)
+        elif errors:
+            msg += "\n\nErreurs:\n" + "\n".join(f"• {name}: {detail}" for name, detail in errors)
             messagebox.showwarning("Export terminé", msg)
         else:
-            output_dir = self.session_manager.get_output_dir()
-            msg += f"\n\nDossier: {output_dir}"
+            msg += f"\n\nDossier: {session.output_dir}"
             messagebox.showinfo("Export terminé", msg)
 
 
@@ -829,6 +1179,7 @@ class TCPDataProcessorSession(ctk.CTk):
         
         self._set_icon()
         self._create_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         
         # Auto-connect if URI was saved previously
         if self.mongo_service.uri:
@@ -842,6 +1193,14 @@ class TCPDataProcessorSession(ctk.CTk):
         except Exception:
             pass
     
+    def _on_close(self):
+        # Pages own thread/process pools, stop them before Tk goes away
+        for page in self._pages.values():
+            shutdown = getattr(page, 'shutdown', None)
+            if shutdown is not None:
+                shutdown()
+        self.destroy()
+    
     def _create_ui(self):
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -860,12 +1219,12 @@ class TCPDataProcessorSession(ctk.CTk):
         # App name -------------------------------------------------------
         ctk.CTkLabel(
             self.sidebar, text="ENDURAW",
-            font=ctk.CTkFont(size=20, weight="bold"),
+            font=get_font(20, "bold"),
         ).grid(row=0, column=0, padx=20, pady=(24, 4), sticky="w")
 
         ctk.CTkLabel(
             self.sidebar, text="Testing Tool",
-            font=ctk.CTkFont(size=12), text_color="gray",
+            font=get_font(12), text_color="gray",
         ).grid(row=1, column=0, padx=20, pady=(0, 16), sticky="w")
 
         # Separator -------------------------------------------------------
@@ -881,8 +1240,11 @@ class TCPDataProcessorSession(ctk.CTk):
         self._nav_buttons: Dict[str, ctk.CTkButton] = {}
         self._pages: Dict[str, ctk.CTkFrame] = {}
         self._current_page: Optional[str] = None
+        # Pages showing an older session; refreshed when (next) visible
+        self._stale_pages: set = set()
+        self._refresh_after_id = None
 
-        nav_items = ["Sessions", "Profils", "XML Matching"]
+        nav_items = [_PAGE_SESSIONS, _PAGE_PROFILES, _PAGE_XML_MATCHING]
         for idx, name in enumerate(nav_items):
             btn = ctk.CTkButton(
                 nav_frame, text=name, anchor="w",
@@ -890,7 +1252,7 @@ class TCPDataProcessorSession(ctk.CTk):
                 fg_color="transparent",
                 text_color=SIDEBAR_COLORS["btn_text"],
                 hover_color=SIDEBAR_COLORS["btn_hover"],
-                font=ctk.CTkFont(size=13),
+                font=get_font(13),
                 command=lambda n=name: self._show_page(n),
             )
             btn.grid(row=idx, column=0, sticky="ew", pady=2)
@@ -908,7 +1270,7 @@ class TCPDataProcessorSession(ctk.CTk):
             fg_color="transparent",
             text_color=SIDEBAR_COLORS["btn_text"],
             hover_color=SIDEBAR_COLORS["btn_hover"],
-            font=ctk.CTkFont(size=13),
+            font=get_font(13),
             command=self._open_protocol_manager,
         )
         self.settings_btn.grid(row=5, column=0, sticky="ew", padx=8, pady=2)
@@ -927,7 +1289,7 @@ class TCPDataProcessorSession(ctk.CTk):
             fg_color="transparent",
             text_color="gray",
             hover_color=SIDEBAR_COLORS["btn_hover"],
-            font=ctk.CTkFont(size=12),
+            font=get_font(12),
             command=self._toggle_theme,
         )
         self.theme_btn.grid(row=0, column=0, sticky="ew", pady=2)
@@ -949,46 +1311,81 @@ class TCPDataProcessorSession(ctk.CTk):
         self.content.grid_columnconfigure(0, weight=1)
         self.content.grid_rowconfigure(0, weight=1)
 
-        # Session page
+        # Session page (default view, built right away)
         self.session_tab = SessionTab(
             self.content, self.session_manager,
             on_session_loaded=self._on_session_loaded,
         )
-        self._pages["Sessions"] = self.session_tab
-
-        # Profile page
-        self.profile_tab = ProfileTab(
-            self.content, self.session_manager,
-            mongo_service=self.mongo_service,
-            protocol_store=self.protocol_store,
-        )
-        self._pages["Profils"] = self.profile_tab
-
-        # XML Match page
-        self.match_tab = XmlMatchTab(
-            self.content, self.session_manager,
-            mongo_service=self.mongo_service,
-        )
-        self._pages["XML Matching"] = self.match_tab
+        self._pages[_PAGE_SESSIONS] = self.session_tab
+
+        # Profile and XML Match pages are built on first visit
+        self._page_factories = {
+            _PAGE_PROFILES: lambda: ProfileTab(
+                self.content, self.session_manager,
+                mongo_service=self.mongo_service,
+                protocol_store=self.protocol_store,
+            ),
+            _PAGE_XML_MATCHING: lambda: XmlMatchTab(
+                self.content, self.session_manager,
+                mongo_service=self.mongo_service,
+            ),
+        }
 
         # Session info label (top-right, inside mongo bar or header)
         # (already part of mongo bar)
 
         # Show first page
-        self._show_page("Sessions")
+        self._show_page(_PAGE_SESSIONS)
+        
+        # Widgets can only be built on the Tk thread: warm the other pages
+        # up there once the window is drawn, one page per event-loop turn
+        self.after(self.PREBUILD_DELAY_MS, self._prebuild_next_page)
 
     # ------------------------------------------------------------------ #
     #  Sidebar navigation helpers                                         #
     # ------------------------------------------------------------------ #
+    def _get_page(self, name: str) -> ctk.CTkFrame:
+        """Return a page, building it on first use."""
+        page = self._pages.get(name)
+        if page is None:
+            page = self._page_factories[name]()
+            self._pages[name] = page
+            # It missed the session-loaded refresh, catch up when shown
+            if self.session_manager.current_session:
+                self._stale_pages.add(page)
+        return page
+
+    PREBUILD_DELAY_MS = 1000
+    
+    def _prebuild_next_page(self):
+        """Build one not-yet-visited page, then yield to the event loop"""
+        for name in self._page_factories:
+            if name not in self._pages:
+                self._get_page(name)
+                self.after_idle(self._prebuild_next_page)
+                return
+
+    @property
+    def profile_tab(self) -> ProfileTab:
+        return self._get_page(_PAGE_PROFILES)
+
+    @property
+    def match_tab(self) -> XmlMatchTab:
+        return self._get_page(_PAGE_XML_MATCHING)
+
     def _show_page(self, name: str):
         """Show the requested page and highlight its nav button."""
         if self._current_page == name:
             return
-        # Hide all pages
-        for page in self._pages.values():
-            page.pack_forget()
-        # Show selected
-        self._pages[name].pack(in_=self.content, fill="both", expand=True)
+        page = self._get_page(name)
+        # Hide the previous page, show the selected one
+        if self._current_page in self._pages:
+            self._pages[self._current_page].grid_remove()
+        # All pages share content's single stretched cell (configured once)
+        page.grid(row=0, column=0, sticky="nsew")
+        if page in self._stale_pages:
+            self._stale_pages.discard(page)
+            self.after_idle(page.refresh)
         # Update button styles
         for btn_name, btn in self._nav_buttons.items():
             if btn_name == name:
@@ -1008,14 +1405,15 @@ class TCPDataProcessorSession(ctk.CTk):
         bar.grid_columnconfigure(2, weight=1)
 
         # Session info (left side)
+        self._session_info_var = tk.StringVar(self, value="Aucune session active")
         self.session_info = ctk.CTkLabel(
-            bar, text="Aucune session active", text_color="gray",
-            font=ctk.CTkFont(size=12),
+            bar, textvariable=self._session_info_var, text_color="gray",
+            font=get_font(12),
         )
         self.session_info.grid(row=0, column=0, padx=(15, 20), pady=8)
 
         # DB label
-        db_label = ctk.CTkLabel(bar, text="MongoDB", font=ctk.CTkFont(size=12))
+        db_label = ctk.CTkLabel(bar, text="MongoDB", font=get_font(12))
         db_label.grid(row=0, column=1, padx=(10, 5), pady=8)
 
         # URI entry
@@ -1035,7 +1433,7 @@ class TCPDataProcessorSession(ctk.CTk):
         self.toggle_uri_btn = ctk.CTkButton(
             bar, text="Afficher", width=60, height=28,
             fg_color="transparent", hover_color=("gray80", "gray30"),
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             command=self._toggle_uri_visibility,
         )
         self.toggle_uri_btn.grid(row=0, column=3, padx=2, pady=8)
@@ -1050,7 +1448,7 @@ class TCPDataProcessorSession(ctk.CTk):
         # Status indicator
         self.mongo_status_label = ctk.CTkLabel(
             bar, text="Deconnecte", text_color="gray",
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
         )
         self.mongo_status_label.grid(row=0, column=5, padx=(5, 15), pady=8)
     
@@ -1077,56 +1475,90 @@ class TCPDataProcessorSession(ctk.CTk):
             messagebox.showwarning("Attention", "Veuillez saisir l'URI MongoDB")
             return
         
+        self._start_mongo_connect(uri, auto=False)
+    
+    def _auto_connect_mongo(self):
+        """Try to auto-connect using saved URI."""
+        self._start_mongo_connect("", auto=True)
+    
+    def _start_mongo_connect(self, uri: str, auto: bool):
+        """Connect on a background thread, DNS/TLS may take seconds"""
+        self.mongo_connect_btn.configure(state="disabled")
         self.mongo_status_label.configure(text="Connexion...", text_color="orange")
-        self.update_idletasks()
-        
+        threading.Thread(target=self._do_mongo_connect, args=(uri, auto), daemon=True).start()
+    
+    def _do_mongo_connect(self, uri: str, auto: bool):
+        """Background thread: connect and load users, then report on the Tk thread"""
         try:
             self.mongo_service.connect(uri=uri)
-            nb_users = len(self.mongo_service.get_all_users())
-            self.mongo_connect_btn.configure(text="Deconnecter", fg_color="#c0392b", hover_color="#a93226")
-            self.mongo_status_label.configure(
-                text=f"Connecte ({nb_users} users)", text_color="#2fa572"
-            )
+            nb_users = self.mongo_service.count_users()
+            error = None
         except Exception as e:
-            self.mongo_status_label.configure(text="Erreur", text_color="#c0392b")
-            messagebox.showerror("Erreur MongoDB", f"Connexion echouee:\n{e}")
+            nb_users, error = 0, e
+        _call_on_tk(self, self._apply_mongo_connect, nb_users, error, auto)
     
-    def _auto_connect_mongo(self):
-        """Try to auto-connect using saved URI."""
-        try:
-            self.mongo_service.connect()
-            nb_users = len(self.mongo_service.get_all_users())
+    def _apply_mongo_connect(self, nb_users: int, error: Optional[Exception], auto: bool):
+        """Main thread: show the outcome of _do_mongo_connect"""
+        self.mongo_connect_btn.configure(state="normal")
+        if error is None:
             self.mongo_connect_btn.configure(text="Deconnecter", fg_color="#c0392b", hover_color="#a93226")
             self.mongo_status_label.configure(
                 text=f"Connecte ({nb_users} users)", text_color="#2fa572"
             )
-        except Exception:
+        elif auto:
             self.mongo_status_label.configure(text="Auto-connect echoue", text_color="#f0ad4e")
+        else:
+            self.mongo_status_label.configure(text="Erreur", text_color="#c0392b")
+            messagebox.showerror("Erreur MongoDB", f"Connexion echouee:\n{error}")
     
     def _on_session_loaded(self):
         """Called when a session is loaded or created"""
+        # Built pages are out of date; each is refreshed when it is shown,
+        # pages not built yet catch up when first built
+        self._stale_pages.update(self._pages[name] for name in (_PAGE_PROFILES, _PAGE_XML_MATCHING)
+                                 if name in self._pages)
+        
         if self.session_manager.current_session:
             s = self.session_manager.current_session
-            self.session_info.configure(text=f"Session: {s.name}")
+            self._set_session_info(f"Session: {s.name}")
             
             # Switch to Profils page automatically
-            self._show_page("Profils")
+            self._show_page(_PAGE_PROFILES)
         else:
-            self.session_info.configure(text="Aucune session active")
+            self._set_session_info("Aucune session active")
         
-        # Refresh other tabs
-        self.profile_tab.refresh()
-        self.match_tab.refresh()
+        # The page already on screen is refreshed after a short delay, so a
+        # burst of loads collapses into one refresh
+        if self._refresh_after_id is not None:
+            self.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.after(self.SESSION_REFRESH_DELAY_MS, self._refresh_visible_page)
+    
+    SESSION_REFRESH_DELAY_MS = 150
+    
+    def _set_session_info(self, text: str):
+        """Update the session label, skipping the redraw if the text is unchanged"""
+        if text != self._session_info_var.get():
+            self._session_info_var.set(text)
+    
+    def _refresh_visible_page(self):
+        """Debounced: refresh the shown page if stale, hidden ones wait for _show_page"""
+        self._refresh_after_id = None
+        page = self._pages.get(self._current_page)
+        if page in self._stale_pages:
+            self._stale_pages.discard(page)
+            page.refresh()
+    
+    # Current mode -> (mode to switch to, label of the button afterwards)
+    _THEME_NEXT = {
+        "Dark": ("light", "Dark Mode"),
+        "Light": ("dark", "Light Mode"),
+    }
     
     def _toggle_theme(self):
         """Toggle between dark and light mode"""
-        current = ctk.get_appearance_mode()
-        if current == "Dark":
-            ctk.set_appearance_mode("light")
-            self.theme_btn.configure(text="Dark Mode")
-        else:
-            ctk.set_appearance_mode("dark")
-            self.theme_btn.configure(text="Light Mode")
+        new_mode, label = self._THEME_NEXT.get(ctk.get_appearance_mode(), self._THEME_NEXT["Light"])
+        ctk.set_appearance_mode(new_mode)
+        self.theme_btn.configure(text=label)
     
     # ------------------------------------------------------------------ #
     #  Protocol management dialog                                         #
@@ -1135,8 +1567,10 @@ class TCPDataProcessorSession(ctk.CTk):
         """Open the protocol management dialog."""
         dialog = ProtocolManagerDialog(self, self.protocol_store)
         self.wait_window(dialog)
-        # After dialog closes, refresh the dropdown in the form
-        self.profile_tab.form.refresh_protocol_list()
+        # After dialog closes, refresh the dropdown in the form (a profile
+        # page built later reads the list itself)
+        if _PAGE_PROFILES in self._pages:
+            self._pages[_PAGE_PROFILES].form.refresh_protocol_list()
 
 
 class ProtocolManagerDialog(ctk.CTkToplevel):
@@ -1164,7 +1598,7 @@ class ProtocolManagerDialog(ctk.CTkToplevel):
         header.grid_columnconfigure(0, weight=1)
 
         ctk.CTkLabel(header, text="Protocoles de Test",
-                     font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, sticky="w")
+                     font=get_font(16, "bold")).grid(row=0, column=0, sticky="w")
 
         btn_frame = ctk.CTkFrame(header, fg_color="transparent")
         btn_frame.grid(row=0, column=1, sticky="e")
@@ -1186,6 +1620,9 @@ class ProtocolManagerDialog(ctk.CTkToplevel):
         self.proto_listbox = ctk.CTkScrollableFrame(left)
         self.proto_listbox.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
         self.proto_listbox.grid_columnconfigure(0, weight=1)
+        # Row buttons are reused across refreshes, extras are only hidden
+        self._proto_btns: List[ctk.CTkButton] = []
+        self._proto_visible = 0
 
         # ---- Right: detail / editor ----
         right = ctk.CTkFrame(main)
@@ -1221,18 +1658,29 @@ class ProtocolManagerDialog(ctk.CTkToplevel):
     #  List management                                                    #
     # ------------------------------------------------------------------ #
     def _refresh_list(self):
-        """Rebuild the protocol list buttons."""
-        for w in self.proto_listbox.winfo_children():
-            w.destroy()
+        """Sync the protocol list buttons with the store."""
+        names = self.protocol_store.list_names()
+        for i, name in enumerate(names):
+            if i < len(self._proto_btns):
+                btn = self._proto_btns[i]
+                if btn.cget("text") != name:
+                    btn.configure(text=name)
+                if i >= self._proto_visible:
+                    btn.grid()
+            else:
+                # Button i always selects whatever name it currently shows
+                btn = ctk.CTkButton(
+                    self.proto_listbox, text=name, anchor="w",
+                    fg_color="transparent", hover_color=("gray80", "gray30"),
+                    text_color=("gray10", "gray90"),
+                    command=lambda i=i: self._select_protocol(self._proto_btns[i].cget("text"))
+                )
+                btn.grid(row=i, column=0, sticky="ew", pady=1)
+                self._proto_btns.append(btn)
 
-        for name in self.protocol_store.list_names():
-            btn = ctk.CTkButton(
-                self.proto_listbox, text=name, anchor="w",
-                fg_color="transparent", hover_color=("gray80", "gray30"),
-                text_color=("gray10", "gray90"),
-                command=lambda n=name: self._select_protocol(n)
-            )
-            btn.grid(sticky="ew", pady=1)
+        for btn in self._proto_btns[len(names):self._proto_visible]:
+            btn.grid_remove()
+        self._proto_visible = len(names)
 
     def _select_protocol(self, name: str):
         """Load a protocol into the editor."""
@@ -2,11 +2,107 @@
 Tab-based UI components for TCP Data Processor
 """
 import os
+from contextlib import contextmanager
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 from pathlib import Path
 
+from ui.fonts import get_font
+
+
+def reconcile_items(items: Dict[str, ctk.CTkFrame], infos: List[Dict], key: str,
+                    create: Callable[[Dict], ctk.CTkFrame]) -> Dict[str, ctk.CTkFrame]:
+    """
+    Sync a {key: list item} widget map with fresh info dicts.
+    
+    Items whose key disappeared are destroyed, new keys are created with
+    create(info), the others get update_info(info). Items are then gridded
+    in the order of infos; an item already at its row is left alone, so an
+    unchanged list queues no geometry work.
+    
+    Args:
+        items: Current widgets by key
+        infos: New info dicts, in display order
+        key: Info field identifying an item
+        create: Factory building a new list item from an info dict
+        
+    Returns:
+        New {key: item} map, in display order
+    """
+    new_items = {}
+    for info in infos:
+        item_key = info.get(key)
+        item = items.pop(item_key, None)
+        if item is None:
+            item = create(info)
+        else:
+            item.update_info(info)
+        new_items[item_key] = item
+    
+    for item in items.values():
+        item.destroy()
+    
+    for row, item in enumerate(new_items.values()):
+        if getattr(item, '_grid_row', None) != row:
+            item.grid(row=row, column=0, sticky="ew", pady=2)
+            item._grid_row = row
+    return new_items
+
+
+@contextmanager
+def batched_items(items):
+    """Hold set_selected/set_matched redraws of items until the block ends"""
+    items = list(items)
+    for item in items:
+        item.begin_batch()
+    try:
+        yield
+    finally:
+        for item in items:
+            if item.winfo_exists():
+                item.end_batch()
+
+
+class _ItemStateMixin:
+    """Selected/matched state for list items, redrawn only when it changes"""
+    
+    def _init_state(self):
+        self.is_selected = False
+        self.is_matched = False
+        self._suspended = False
+        self._drawn_selected = False
+        self._drawn_matched = False
+    
+    def begin_batch(self):
+        """Record state changes without redrawing until end_batch()"""
+        self._suspended = True
+    
+    def end_batch(self):
+        self._suspended = False
+        self._apply_state()
+    
+    def set_selected(self, selected: bool):
+        self.is_selected = selected
+        if not self._suspended:
+            self._apply_state()
+    
+    def set_matched(self, matched: bool):
+        self.is_matched = matched
+        if not self._suspended:
+            self._apply_state()
+    
+    def _apply_state(self):
+        if self.is_selected != self._drawn_selected:
+            self._drawn_selected = self.is_selected
+            self.configure(fg_color=("gray85", "gray25") if self.is_selected else "transparent")
+        if self.is_matched != self._drawn_matched:
+            self._drawn_matched = self.is_matched
+            if self.is_matched:
+                self.status_label.configure(text="●", text_color="green")
+            else:
+                self.status_label.configure(text="○", text_color="gray")
+
 
 class SessionListItem(ctk.CTkFrame):
     """Individual session item in the list"""
@@ -21,18 +117,15 @@ class SessionListItem(ctk.CTkFrame):
         self.grid_columnconfigure(0, weight=1)
         
         # Name label
-        name = session_info.get('name', 'Unknown')
         self.name_label = ctk.CTkLabel(
-            self, text=name, font=ctk.CTkFont(weight="bold"), anchor="w"
+            self, text=self._name_text(session_info), font=get_font(weight="bold"), anchor="w"
         )
         self.name_label.grid(row=0, column=0, padx=10, pady=2, sticky="w")
         
         # Info label
-        date = session_info.get('date', '')
-        location = session_info.get('location', '')
         self.info_label = ctk.CTkLabel(
-            self, text=f"{date} - {location}",
-            font=ctk.CTkFont(size=11), text_color="gray", anchor="w"
+            self, text=self._info_text(session_info),
+            font=get_font(11), text_color="gray", anchor="w"
         )
         self.info_label.grid(row=1, column=0, padx=10, pady=0, sticky="w")
         
@@ -41,6 +134,22 @@ class SessionListItem(ctk.CTkFrame):
         self.name_label.bind("<Button-1>", self._on_click)
         self.info_label.bind("<Button-1>", self._on_click)
     
+    @staticmethod
+    def _name_text(session_info: Dict) -> str:
+        return session_info.get('name', 'Unknown')
+    
+    @staticmethod
+    def _info_text(session_info: Dict) -> str:
+        return f"{session_info.get('date', '')} - {session_info.get('location', '')}"
+    
+    def update_info(self, session_info: Dict):
+        """Point the item at new session info, relabelling only if needed"""
+        old_info, self.session_info = self.session_info, session_info
+        if self._name_text(session_info) != self._name_text(old_info):
+            self.name_label.configure(text=self._name_text(session_info))
+        if self._info_text(session_info) != self._info_text(old_info):
+            self.info_label.configure(text=self._info_text(session_info))
+    
     def _on_click(self, event):
         if self.on_select:
             self.on_select(self)
@@ -50,38 +159,35 @@ class SessionListItem(ctk.CTkFrame):
         self.configure(fg_color=("gray85", "gray25") if selected else "transparent")
 
 
-class ProfileListItem(ctk.CTkFrame):
+class ProfileListItem(_ItemStateMixin, ctk.CTkFrame):
     """Individual profile item in the list"""
     
     def __init__(self, master, profile_info: Dict, on_select=None, **kwargs):
         super().__init__(master, **kwargs)
         self.profile_info = profile_info
         self.on_select = on_select
-        self.is_selected = False
-        self.is_matched = False
+        self._init_state()
         
         self.configure(fg_color="transparent", corner_radius=5)
         self.grid_columnconfigure(0, weight=1)
         
         # Name
-        name = f"{profile_info.get('last_name', '')} {profile_info.get('first_name', '')}"
         self.name_label = ctk.CTkLabel(
-            self, text=name.strip() or "Sans nom",
-            font=ctk.CTkFont(weight="bold"), anchor="w"
+            self, text=self._name_text(profile_info),
+            font=get_font(weight="bold"), anchor="w"
         )
         self.name_label.grid(row=0, column=0, padx=10, pady=2, sticky="w")
         
         # Email
-        email = profile_info.get('email', '')
         self.email_label = ctk.CTkLabel(
-            self, text=email or "Pas d'email",
-            font=ctk.CTkFont(size=11), text_color="gray", anchor="w"
+            self, text=self._email_text(profile_info),
+            font=get_font(11), text_color="gray", anchor="w"
         )
         self.email_label.grid(row=1, column=0, padx=10, pady=0, sticky="w")
         
         # Status indicator
         self.status_label = ctk.CTkLabel(
-            self, text="○", font=ctk.CTkFont(size=12), text_color="gray"
+            self, text="○", font=get_font(12), text_color="gray"
         )
         self.status_label.grid(row=0, column=1, rowspan=2, padx=10)
         
@@ -90,54 +196,64 @@ class ProfileListItem(ctk.CTkFrame):
         self.name_label.bind("<Button-1>", self._on_click)
         self.email_label.bind("<Button-1>", self._on_click)
     
+    @staticmethod
+    def _name_text(profile_info: Dict) -> str:
+        # display_name is precomputed by SessionManager.list_profiles
+        name = profile_info.get('display_name')
+        if name is None:
+            name = f"{profile_info.get('last_name', '')} {profile_info.get('first_name', '')}".strip()
+        return name or "Sans nom"
+    
+    @staticmethod
+    def _email_text(profile_info: Dict) -> str:
+        return profile_info.get('email', '') or "Pas d'email"
+    
+    def update_info(self, profile_info: Dict):
+        """Point the item at new profile info, relabelling only if needed"""
+        old_info, self.profile_info = self.profile_info, profile_info
+        if self._name_text(profile_info) != self._name_text(old_info):
+            self.name_label.configure(text=self._name_text(profile_info))
+        if self._email_text(profile_info) != self._email_text(old_info):
+            self.email_label.configure(text=self._email_text(profile_info))
+    
+    def refresh_selected(self, selected_filename: Optional[str]):
+        """Highlight the item iff it is the selected profile"""
+        self.set_selected(self.profile_info.get('filename') == selected_filename)
+    
     def _on_click(self, event):
         if self.on_select:
             self.on_select(self)
-    
-    def set_selected(self, selected: bool):
-        self.is_selected = selected
-        self.configure(fg_color=("gray85", "gray25") if selected else "transparent")
-    
-    def set_matched(self, matched: bool):
-        self.is_matched = matched
-        if matched:
-            self.status_label.configure(text="●", text_color="green")
-        else:
-            self.status_label.configure(text="○", text_color="gray")
 
 
-class XmlListItem(ctk.CTkFrame):
+class XmlListItem(_ItemStateMixin, ctk.CTkFrame):
     """Individual XML item in the list"""
     
     def __init__(self, master, xml_info: Dict, on_select=None, **kwargs):
         super().__init__(master, **kwargs)
         self.xml_info = xml_info
         self.on_select = on_select
-        self.is_selected = False
-        self.is_matched = False
+        self._init_state()
         
         self.configure(fg_color="transparent", corner_radius=5)
         self.grid_columnconfigure(0, weight=1)
         
         # Filename
-        filename = xml_info.get('filename', 'Unknown')
         self.name_label = ctk.CTkLabel(
-            self, text=filename[:40] + "..." if len(filename) > 40 else filename,
-            font=ctk.CTkFont(weight="bold"), anchor="w"
+            self, text=self._name_text(xml_info),
+            font=get_font(weight="bold"), anchor="w"
         )
         self.name_label.grid(row=0, column=0, padx=10, pady=2, sticky="w")
         
         # Name from filename
-        name = f"{xml_info.get('last_name', '')} {xml_info.get('first_name', '')}"
         self.info_label = ctk.CTkLabel(
-            self, text=name.strip() or "Nom inconnu",
-            font=ctk.CTkFont(size=11), text_color="gray", anchor="w"
+            self, text=self._info_text(xml_info),
+            font=get_font(11), text_color="gray", anchor="w"
         )
         self.info_label.grid(row=1, column=0, padx=10, pady=0, sticky="w")
         
         # Status
         self.status_label = ctk.CTkLabel(
-            self, text="○", font=ctk.CTkFont(size=12), text_color="gray"
+            self, text="○", font=get_font(12), text_color="gray"
         )
         self.status_label.grid(row=0, column=1, rowspan=2, padx=10)
         
@@ -146,20 +262,31 @@ class XmlListItem(ctk.CTkFrame):
         self.name_label.bind("<Button-1>", self._on_click)
         self.info_label.bind("<Button-1>", self._on_click)
     
+    @staticmethod
+    def _name_text(xml_info: Dict) -> str:
+        filename = xml_info.get('filename', 'Unknown')
+        return filename[:40] + "..." if len(filename) > 40 else filename
+    
+    @staticmethod
+    def _info_text(xml_info: Dict) -> str:
+        name = f"{xml_info.get('last_name', '')} {xml_info.get('first_name', '')}"
+        return name.strip() or "Nom inconnu"
+    
+    def update_info(self, xml_info: Dict):
+        """Point the item at new XML info, relabelling only if needed"""
+        old_info, self.xml_info = self.xml_info, xml_info
+        if self._name_text(xml_info) != self._name_text(old_info):
+            self.name_label.configure(text=self._name_text(xml_info))
+        if self._info_text(xml_info) != self._info_text(old_info):
+            self.info_label.configure(text=self._info_text(xml_info))
+    
+    def refresh_selected(self, selected_filename: Optional[str]):
+        """Highlight the item iff it is the selected XML"""
+        self.set_selected(self.xml_info.get('filename') == selected_filename)
+    
     def _on_click(self, event):
         if self.on_select:
             self.on_select(self)
-    
-    def set_selected(self, selected: bool):
-        self.is_selected = selected
-        self.configure(fg_color=("gray85", "gray25") if selected else "transparent")
-    
-    def set_matched(self, matched: bool):
-        self.is_matched = matched
-        if matched:
-            self.status_label.configure(text="●", text_color="green")
-        else:
-            self.status_label.configure(text="○", text_color="gray")
 
 
 class MatchListItem(ctk.CTkFrame):
@@ -176,15 +303,14 @@ class MatchListItem(ctk.CTkFrame):
         profile = match_info.get('profile_name', '')
         self.profile_label = ctk.CTkLabel(
             self, text=f"{profile}",
-            font=ctk.CTkFont(weight="bold"), anchor="w"
+            font=get_font(weight="bold"), anchor="w"
         )
         self.profile_label.grid(row=0, column=0, padx=10, pady=2, sticky="w")
         
         # XML name
-        xml = match_info.get('xml_filename', '')
         self.xml_label = ctk.CTkLabel(
-            self, text=f"{xml[:30]}..." if len(xml) > 30 else xml,
-            font=ctk.CTkFont(size=11), text_color="gray", anchor="w"
+            self, text=self._xml_text(match_info),
+            font=get_font(11), text_color="gray", anchor="w"
         )
         self.xml_label.grid(row=1, column=0, padx=10, pady=0, sticky="w")
         
@@ -198,7 +324,7 @@ class MatchListItem(ctk.CTkFrame):
             btn_frame, text="Exporte" if exported else "Exporter",
             width=80, height=28,
             fg_color="#2fa572" if exported else None,
-            command=lambda: on_export(match_info) if on_export else None
+            command=lambda: on_export(self.match_info) if on_export else None
         )
         self.export_btn.grid(row=0, column=0, padx=2)
         
@@ -206,6 +332,23 @@ class MatchListItem(ctk.CTkFrame):
         self.remove_btn = ctk.CTkButton(
             btn_frame, text="X", width=30, height=28,
             fg_color="#c0392b", hover_color="#a93226",
-            command=lambda: on_remove(match_info) if on_remove else None
+            command=lambda: on_remove(self.match_info) if on_remove else None
         )
         self.remove_btn.grid(row=0, column=1, padx=2)
+    
+    @staticmethod
+    def _xml_text(match_info: Dict) -> str:
+        xml = match_info.get('xml_filename', '')
+        return f"{xml[:30]}..." if len(xml) > 30 else xml
+    
+    def update_info(self, match_info: Dict):
+        """Point the item at new match info, relabelling only if needed"""
+        old_info, self.match_info = self.match_info, match_info
+        if self._xml_text(match_info) != self._xml_text(old_info):
+            self.xml_label.configure(text=self._xml_text(match_info))
+        exported = match_info.get('exported', False)
+        if exported != old_info.get('exported', False):
+            self.export_btn.configure(
+                text="Exporte" if exported else "Exporter",
+                fg_color="#2fa572" if exported else ctk.ThemeManager.theme["CTkButton"]["fg_color"]
+            )
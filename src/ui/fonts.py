@@ -0,0 +1,18 @@
+"""
+Shared widget fonts - one CTkFont per (size, weight, slant), created on first use
+"""
+from functools import lru_cache
+from typing import Optional
+
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=None)
+def get_font(size: Optional[int] = None, weight: str = "normal", slant: str = "roman") -> ctk.CTkFont:
+    """
+    Return the shared font for this size/weight/slant (size None = theme default).
+    
+    Fonts need a Tk root, so only call this once the app window exists
+    (i.e. from widget construction code, never at import time).
+    """
+    return ctk.CTkFont(size=size, weight=weight, slant=slant)
@@ -5,17 +5,140 @@ Tabbed Input Form - 3 onglets pour la saisie profil
   3. Analyse : synthèse des résultats + conseils / commentaires métier
 """
 import customtkinter as ctk
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pydantic import ValidationError
-from core.validation_models import ProfileFormModel
+from core.validation_models import validate_profile_dict
 from core.protocol_store import ProtocolStore
+from ui.fonts import get_font
 
 import matplotlib
 matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
+# Flat form key -> Pydantic model path
+FIELD_MAPPING: Dict[str, Tuple[str, ...]] = {
+    'email': ('email',),
+
+    # Consent
+    'consent_risques': ('consentements', 'risques'),
+    'consent_donnees': ('consentements', 'donnees'),
+    'consent_anonyme': ('consentements', 'anonyme'),
+    'consent_image': ('consentements', 'image'),
+
+    # Identity
+    'last_name': ('identity', 'last_name'),
+    'first_name': ('identity', 'first_name'),
+    'date_of_birth': ('identity', 'date_of_birth'),
+    'age': ('identity', 'age'),
+    'sport_practiced': ('identity', 'sport_practiced'),
+    'specialty': ('identity', 'specialty'),
+    'has_coach': ('identity', 'has_coach'),
+
+    # Body
+    'height_cm': ('body_composition', 'height_cm'),
+    'current_weight': ('body_composition', 'current_weight'),
+    'weight_before_test': ('body_composition', 'weight_before_test'),
+    'weight_after_test': ('body_composition', 'weight_after_test'),
+    'altitude_vie': ('altitude_vie_m',),
+
+    # SpO2
+    'spo2_avant': ('spo2', 'avant'),
+    'spo2_apres': ('spo2', 'apres'),
+    'lactatemie_repos': ('lactatemie_repos',),
+
+    # Job
+    'job_title': ('professional_life', 'job_title'),
+    'working_hours_per_week': ('professional_life', 'working_hours_per_week'),
+
+    # Equipment
+    'watch_brand': ('equipment_and_tracking', 'watch_brand'),
+    'watch_estimated_vo2': ('equipment_and_tracking', 'watch_estimated_vo2'),
+    'min_hr_before': ('equipment_and_tracking', 'min_hr_before'),
+    'max_hr_ever': ('equipment_and_tracking', 'max_hr_ever'),
+    'average_weekly_volume': ('equipment_and_tracking', 'average_weekly_volume'),
+
+    # Predictions
+    'prediction_5k': ('equipment_and_tracking', 'watch_race_predictions', '5k'),
+    'prediction_10k': ('equipment_and_tracking', 'watch_race_predictions', '10k'),
+    'prediction_half': ('equipment_and_tracking', 'watch_race_predictions', 'half_marathon'),
+    'prediction_marathon': ('equipment_and_tracking', 'watch_race_predictions', 'marathon'),
+
+    # Records
+    'record_5k': ('history_and_goals', 'personal_records', '5k'),
+    'record_10k': ('history_and_goals', 'personal_records', '10k'),
+    'record_half': ('history_and_goals', 'personal_records', 'half_marathon'),
+    'record_marathon': ('history_and_goals', 'personal_records', 'marathon'),
+    'utmb_index': ('history_and_goals', 'utmb_index'),
+    'upcoming_goals': ('history_and_goals', 'upcoming_goals'),
+
+    # Context
+    'seance_veille': ('seance_veille',),
+    'observations': ('observations',),
+    'protocol_description': ('protocol_description',),
+
+    # Results
+    'measured_vo2max': ('stress_test_results', 'measured_vo2max'),
+    'max_hr': ('stress_test_results', 'max_hr'),
+    'vma': ('stress_test_results', 'vma'),
+    'first_stage_speed': ('stress_test_results', 'first_stage_speed'),
+    'last_stage_speed': ('stress_test_results', 'last_stage_speed'),
+
+    # SV1
+    'sv1_hr': ('stress_test_results', 'thresholds', 'sv1', 'hr_bpm'),
+    'sv1_speed': ('stress_test_results', 'thresholds', 'sv1', 'pace_km_h'),
+    'sv1_vo2': ('stress_test_results', 'thresholds', 'sv1', 'vo2_ml_kg_min'),
+
+    # SV2
+    'sv2_hr': ('stress_test_results', 'thresholds', 'sv2', 'hr_bpm'),
+    'sv2_speed': ('stress_test_results', 'thresholds', 'sv2', 'pace_km_h'),
+    'sv2_vo2': ('stress_test_results', 'thresholds', 'sv2', 'vo2_ml_kg_min'),
+
+    # RSI / CMJ
+    'rsi_avant': ('rsi', 'avant'),
+    'rsi_apres': ('rsi', 'apres'),
+    'cmj_avant_hauteur': ('cmj', 'avant', 'hauteur_cm'),
+    'cmj_avant_force': ('cmj', 'avant', 'force_max_kfg_kg'),
+    'cmj_avant_puissance': ('cmj', 'avant', 'puissance_max_w_kg'),
+    'cmj_apres_hauteur': ('cmj', 'apres', 'hauteur_cm'),
+    'cmj_apres_force': ('cmj', 'apres', 'force_max_kfg_kg'),
+    'cmj_apres_puissance': ('cmj', 'apres', 'puissance_max_w_kg'),
+
+    # Others
+    'conseils_entrainements': ('conseils_entrainements',),
+    'notes_privees': ('notes_privees',),
+}
+
+# Pydantic error location -> flat form key
+PATH_TO_KEY: Dict[Tuple[str, ...], str] = {path: key for key, path in FIELD_MAPPING.items()}
+
+# Analyse summary label -> flat form key it displays
+_SUMMARY_FIELDS = {
+    "sum_vo2max": "measured_vo2max",
+    "sum_vma": "vma",
+    "sum_fcmax": "max_hr",
+    "sum_sv1_hr": "sv1_hr",
+    "sum_sv1_speed": "sv1_speed",
+    "sum_sv1_vo2": "sv1_vo2",
+    "sum_sv2_hr": "sv2_hr",
+    "sum_sv2_speed": "sv2_speed",
+    "sum_sv2_vo2": "sv2_vo2",
+    "sum_weight": "current_weight",
+    "sum_sport": "sport_practiced",
+}
+
+# (summary label, threshold key, reference maximum key) for the percentage rows
+_SUMMARY_RATIOS = (
+    ("sum_sv1_hr_pct", "sv1_hr", "max_hr"),
+    ("sum_sv1_speed_pct", "sv1_speed", "vma"),
+    ("sum_sv1_vo2_pct", "sv1_vo2", "measured_vo2max"),
+    ("sum_sv2_hr_pct", "sv2_hr", "max_hr"),
+    ("sum_sv2_speed_pct", "sv2_speed", "vma"),
+    ("sum_sv2_vo2_pct", "sv2_vo2", "measured_vo2max"),
+)
+
+
 class TabbedInputForm(ctk.CTkFrame):
     """Form with 3 tabs: Profil/Perso, Mesures Test, Analyse"""
 
@@ -27,8 +150,12 @@ class TabbedInputForm(ctk.CTkFrame):
         self.entries: Dict[str, Dict] = {}
         self.lactate_entries: List[Dict] = []
         self.summary_labels: Dict[str, ctk.CTkLabel] = {}
+        # True when summary inputs may have changed since the last _update_summary
+        self._dirty = True
+        # Tk validatecommand that only records the edit, see _watch_edits
+        self._edit_vcmd = (self.register(self._on_entry_change),)
 
-        self._init_field_mapping()
+        self.field_mapping = FIELD_MAPPING
 
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -45,106 +172,11 @@ class TabbedInputForm(ctk.CTkFrame):
         self._create_profil_tab()
         self._create_mesures_tab()
         self._create_analyse_tab()
+        self._bind_entry_edits()
 
         # Refresh summary when switching to Analyse tab
         self.tabview.configure(command=self._on_tab_changed)
 
-    # ------------------------------------------------------------------ #
-    #  Field mapping  (flat key -> Pydantic model path)
-    # ------------------------------------------------------------------ #
-    def _init_field_mapping(self):
-        self.field_mapping = {
-            'email': ('email',),
-
-            # Consent
-            'consent_risques': ('consentements', 'risques'),
-            'consent_donnees': ('consentements', 'donnees'),
-            'consent_anonyme': ('consentements', 'anonyme'),
-            'consent_image': ('consentements', 'image'),
-
-            # Identity
-            'last_name': ('identity', 'last_name'),
-            'first_name': ('identity', 'first_name'),
-            'date_of_birth': ('identity', 'date_of_birth'),
-            'age': ('identity', 'age'),
-            'sport_practiced': ('identity', 'sport_practiced'),
-            'specialty': ('identity', 'specialty'),
-            'has_coach': ('identity', 'has_coach'),
-
-            # Body
-            'height_cm': ('body_composition', 'height_cm'),
-            'current_weight': ('body_composition', 'current_weight'),
-            'weight_before_test': ('body_composition', 'weight_before_test'),
-            'weight_after_test': ('body_composition', 'weight_after_test'),
-            'altitude_vie': ('altitude_vie_m',),
-
-            # SpO2
-            'spo2_avant': ('spo2', 'avant'),
-            'spo2_apres': ('spo2', 'apres'),
-            'lactatemie_repos': ('lactatemie_repos',),
-
-            # Job
-            'job_title': ('professional_life', 'job_title'),
-            'working_hours_per_week': ('professional_life', 'working_hours_per_week'),
-
-            # Equipment
-            'watch_brand': ('equipment_and_tracking', 'watch_brand'),
-            'watch_estimated_vo2': ('equipment_and_tracking', 'watch_estimated_vo2'),
-            'min_hr_before': ('equipment_and_tracking', 'min_hr_before'),
-            'max_hr_ever': ('equipment_and_tracking', 'max_hr_ever'),
-            'average_weekly_volume': ('equipment_and_tracking', 'average_weekly_volume'),
-
-            # Predictions
-            'prediction_5k': ('equipment_and_tracking', 'watch_race_predictions', '5k'),
-            'prediction_10k': ('equipment_and_tracking', 'watch_race_predictions', '10k'),
-            'prediction_half': ('equipment_and_tracking', 'watch_race_predictions', 'half_marathon'),
-            'prediction_marathon': ('equipment_and_tracking', 'watch_race_predictions', 'marathon'),
-
-            # Records
-            'record_5k': ('history_and_goals', 'personal_records', '5k'),
-            'record_10k': ('history_and_goals', 'personal_records', '10k'),
-            'record_half': ('history_and_goals', 'personal_records', 'half_marathon'),
-            'record_marathon': ('history_and_goals', 'personal_records', 'marathon'),
-            'utmb_index': ('history_and_goals', 'utmb_index'),
-            'upcoming_goals': ('history_and_goals', 'upcoming_goals'),
-
-            # Context
-            'seance_veille': ('seance_veille',),
-            'observations': ('observations',),
-            'protocol_description': ('protocol_description',),
-
-            # Results
-            'measured_vo2max': ('stress_test_results', 'measured_vo2max'),
-            'max_hr': ('stress_test_results', 'max_hr'),
-            'vma': ('stress_test_results', 'vma'),
-            'first_stage_speed': ('stress_test_results', 'first_stage_speed'),
-            'last_stage_speed': ('stress_test_results', 'last_stage_speed'),
-
-            # SV1
-            'sv1_hr': ('stress_test_results', 'thresholds', 'sv1', 'hr_bpm'),
-            'sv1_speed': ('stress_test_results', 'thresholds', 'sv1', 'pace_km_h'),
-            'sv1_vo2': ('stress_test_results', 'thresholds', 'sv1', 'vo2_ml_kg_min'),
-
-            # SV2
-            'sv2_hr': ('stress_test_results', 'thresholds', 'sv2', 'hr_bpm'),
-            'sv2_speed': ('stress_test_results', 'thresholds', 'sv2', 'pace_km_h'),
-            'sv2_vo2': ('stress_test_results', 'thresholds', 'sv2', 'vo2_ml_kg_min'),
-
-            # RSI / CMJ
-            'rsi_avant': ('rsi', 'avant'),
-            'rsi_apres': ('rsi', 'apres'),
-            'cmj_avant_hauteur': ('cmj', 'avant', 'hauteur_cm'),
-            'cmj_avant_force': ('cmj', 'avant', 'force_max_kfg_kg'),
-            'cmj_avant_puissance': ('cmj', 'avant', 'puissance_max_w_kg'),
-            'cmj_apres_hauteur': ('cmj', 'apres', 'hauteur_cm'),
-            'cmj_apres_force': ('cmj', 'apres', 'force_max_kfg_kg'),
-            'cmj_apres_puissance': ('cmj', 'apres', 'puissance_max_w_kg'),
-
-            # Others
-            'conseils_entrainements': ('conseils_entrainements',),
-            'notes_privees': ('notes_privees',),
-        }
-
     # ================================================================== #
     #  TAB 1 – PROFIL / PERSO                                            #
     # ================================================================== #
@@ -339,9 +371,9 @@ class TabbedInputForm(ctk.CTkFrame):
         ]
         for i, (key, label) in enumerate(summary_fields):
             ctk.CTkLabel(summary_frame, text=label, anchor="w",
-                         font=ctk.CTkFont(size=12)).grid(row=i, column=0, padx=10, pady=4, sticky="w")
+                         font=get_font(12)).grid(row=i, column=0, padx=10, pady=4, sticky="w")
             lbl = ctk.CTkLabel(summary_frame, text="—", anchor="e",
-                               font=ctk.CTkFont(size=13, weight="bold"))
+                               font=get_font(13, "bold"))
             lbl.grid(row=i, column=1, padx=10, pady=4, sticky="e")
             self.summary_labels[key] = lbl
         r += 1
@@ -350,7 +382,7 @@ class TabbedInputForm(ctk.CTkFrame):
         sv1_card = ctk.CTkFrame(left, corner_radius=8)
         sv1_card.grid(row=r, column=0, columnspan=2, sticky="ew", pady=5)
         sv1_card.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(sv1_card, text="SV1", font=ctk.CTkFont(size=13, weight="bold"),
+        ctk.CTkLabel(sv1_card, text="SV1", font=get_font(13, "bold"),
                      text_color="#e67e22").grid(
             row=0, column=0, columnspan=2, padx=10, pady=(8, 2))
         for i, (key, label) in enumerate([
@@ -362,7 +394,7 @@ class TabbedInputForm(ctk.CTkFrame):
             ("sum_sv1_vo2_pct", "% VO2max"),
         ]):
             ctk.CTkLabel(sv1_card, text=label, anchor="w").grid(row=i + 1, column=0, padx=10, pady=2, sticky="w")
-            lbl = ctk.CTkLabel(sv1_card, text="—", anchor="e", font=ctk.CTkFont(weight="bold"))
+            lbl = ctk.CTkLabel(sv1_card, text="—", anchor="e", font=get_font(weight="bold"))
             lbl.grid(row=i + 1, column=1, padx=10, pady=2, sticky="e")
             self.summary_labels[key] = lbl
         ctk.CTkLabel(sv1_card, text="").grid(row=7, pady=3)
@@ -372,7 +404,7 @@ class TabbedInputForm(ctk.CTkFrame):
         sv2_card = ctk.CTkFrame(left, corner_radius=8)
         sv2_card.grid(row=r, column=0, columnspan=2, sticky="ew", pady=5)
         sv2_card.grid_columnconfigure(1, weight=1)
-        ctk.CTkLabel(sv2_card, text="SV2", font=ctk.CTkFont(size=13, weight="bold"),
+        ctk.CTkLabel(sv2_card, text="SV2", font=get_font(13, "bold"),
                      text_color="#e74c3c").grid(
             row=0, column=0, columnspan=2, padx=10, pady=(8, 2))
         for i, (key, label) in enumerate([
@@ -384,7 +416,7 @@ class TabbedInputForm(ctk.CTkFrame):
             ("sum_sv2_vo2_pct", "% VO2max"),
         ]):
             ctk.CTkLabel(sv2_card, text=label, anchor="w").grid(row=i + 1, column=0, padx=10, pady=2, sticky="w")
-            lbl = ctk.CTkLabel(sv2_card, text="—", anchor="e", font=ctk.CTkFont(weight="bold"))
+            lbl = ctk.CTkLabel(sv2_card, text="—", anchor="e", font=get_font(weight="bold"))
             lbl.grid(row=i + 1, column=1, padx=10, pady=2, sticky="e")
             self.summary_labels[key] = lbl
         ctk.CTkLabel(sv2_card, text="").grid(row=7, pady=3)
@@ -401,7 +433,7 @@ class TabbedInputForm(ctk.CTkFrame):
             ("sum_weight", "Poids (kg)"),
         ]):
             ctk.CTkLabel(athlete_card, text=label, anchor="w").grid(row=i, column=0, padx=10, pady=3, sticky="w")
-            lbl = ctk.CTkLabel(athlete_card, text="—", anchor="e", font=ctk.CTkFont(weight="bold"))
+            lbl = ctk.CTkLabel(athlete_card, text="—", anchor="e", font=get_font(weight="bold"))
             lbl.grid(row=i, column=1, padx=10, pady=3, sticky="e")
             self.summary_labels[key] = lbl
         ctk.CTkLabel(athlete_card, text="").grid(row=3, pady=2)
@@ -413,6 +445,11 @@ class TabbedInputForm(ctk.CTkFrame):
         self.lactate_graph_frame.grid(row=r, column=0, columnspan=2, sticky="ew", pady=5)
         self.lactate_graph_frame.grid_columnconfigure(0, weight=1)
         self.lactate_canvas = None  # will hold FigureCanvasTkAgg
+        self._lactate_fig = None
+        self._lactate_ax = None
+        self._lactate_line = None
+        self._lactate_placeholder = None
+        self._last_appearance_mode = None
         r += 1
 
         # ---------- RIGHT: CHAMPS ANALYSE ----------
@@ -432,7 +469,12 @@ class TabbedInputForm(ctk.CTkFrame):
     # ------------------------------------------------------------------ #
     def _on_tab_changed(self, tab_name=None):
         """Called when active tab changes"""
-        if self.tabview.get() == "Analyse":
+        if self.tabview.get() != "Analyse":
+            return
+        # A theme switch made on another page still needs the graph rebuilt
+        theme_changed = (self.lactate_canvas is not None
+                         and ctk.get_appearance_mode() != self._last_appearance_mode)
+        if self._dirty or theme_changed:
             self._update_summary()
 
     def _update_summary(self):
@@ -450,26 +492,14 @@ class TabbedInputForm(ctk.CTkFrame):
                 v = w.get().strip()
             return v if v else "—"
 
-        mapping = {
-            "sum_vo2max": "measured_vo2max",
-            "sum_vma": "vma",
-            "sum_fcmax": "max_hr",
-            "sum_sv1_hr": "sv1_hr",
-            "sum_sv1_speed": "sv1_speed",
-            "sum_sv1_vo2": "sv1_vo2",
-            "sum_sv2_hr": "sv2_hr",
-            "sum_sv2_speed": "sv2_speed",
-            "sum_sv2_vo2": "sv2_vo2",
-            "sum_weight": "current_weight",
-            "sum_sport": "sport_practiced",
-        }
-        for sum_key, entry_key in mapping.items():
-            if sum_key in self.summary_labels:
-                self.summary_labels[sum_key].configure(text=_val(entry_key))
+        # Each entry widget is read once; the ratios below reuse these values
+        values = {entry_key: _val(entry_key) for entry_key in _SUMMARY_FIELDS.values()}
+        for sum_key, entry_key in _SUMMARY_FIELDS.items():
+            self._set_sum(sum_key, values[entry_key])
 
         # ---------- Computed percentages ----------
         def _num(key):
-            v = _val(key)
+            v = values[key]
             if v == "—":
                 return None
             try:
@@ -484,111 +514,103 @@ class TabbedInputForm(ctk.CTkFrame):
 
         # VO2 peak (L/min) = vo2max (ml/min/kg) * weight (kg) / 1000
         if vo2max is not None and weight is not None and weight > 0:
-            vo2_peak = round(vo2max * weight / 1000, 2)
-            self.summary_labels.get("sum_vo2_peak", ctk.CTkLabel(self)).configure(text=str(vo2_peak))
+            self._set_sum("sum_vo2_peak", str(round(vo2max * weight / 1000, 2)))
         else:
-            if "sum_vo2_peak" in self.summary_labels:
-                self.summary_labels["sum_vo2_peak"].configure(text="—")
-
-        # SV1 percentages
-        sv1_hr = _num("sv1_hr")
-        sv1_speed = _num("sv1_speed")
-        sv1_vo2 = _num("sv1_vo2")
-        if sv1_hr is not None and fcmax is not None and fcmax > 0:
-            self.summary_labels.get("sum_sv1_hr_pct", ctk.CTkLabel(self)).configure(
-                text=f"{round(sv1_hr / fcmax * 100)}%")
-        else:
-            if "sum_sv1_hr_pct" in self.summary_labels:
-                self.summary_labels["sum_sv1_hr_pct"].configure(text="—")
-        if sv1_speed is not None and vma is not None and vma > 0:
-            self.summary_labels.get("sum_sv1_speed_pct", ctk.CTkLabel(self)).configure(
-                text=f"{round(sv1_speed / vma * 100)}%")
-        else:
-            if "sum_sv1_speed_pct" in self.summary_labels:
-                self.summary_labels["sum_sv1_speed_pct"].configure(text="—")
-        if sv1_vo2 is not None and vo2max is not None and vo2max > 0:
-            self.summary_labels.get("sum_sv1_vo2_pct", ctk.CTkLabel(self)).configure(
-                text=f"{round(sv1_vo2 / vo2max * 100)}%")
-        else:
-            if "sum_sv1_vo2_pct" in self.summary_labels:
-                self.summary_labels["sum_sv1_vo2_pct"].configure(text="—")
-
-        # SV2 percentages
-        sv2_hr = _num("sv2_hr")
-        sv2_speed = _num("sv2_speed")
-        sv2_vo2 = _num("sv2_vo2")
-        if sv2_hr is not None and fcmax is not None and fcmax > 0:
-            self.summary_labels.get("sum_sv2_hr_pct", ctk.CTkLabel(self)).configure(
-                text=f"{round(sv2_hr / fcmax * 100)}%")
-        else:
-            if "sum_sv2_hr_pct" in self.summary_labels:
-                self.summary_labels["sum_sv2_hr_pct"].configure(text="—")
-        if sv2_speed is not None and vma is not None and vma > 0:
-            self.summary_labels.get("sum_sv2_speed_pct", ctk.CTkLabel(self)).configure(
-                text=f"{round(sv2_speed / vma * 100)}%")
-        else:
-            if "sum_sv2_speed_pct" in self.summary_labels:
-                self.summary_labels["sum_sv2_speed_pct"].configure(text="—")
-        if sv2_vo2 is not None and vo2max is not None and vo2max > 0:
-            self.summary_labels.get("sum_sv2_vo2_pct", ctk.CTkLabel(self)).configure(
-                text=f"{round(sv2_vo2 / vo2max * 100)}%")
-        else:
-            if "sum_sv2_vo2_pct" in self.summary_labels:
-                self.summary_labels["sum_sv2_vo2_pct"].configure(text="—")
+            self._set_sum("sum_vo2_peak", "—")
+
+        # SV1 / SV2 percentages of the matching maximum
+        refs = {"max_hr": fcmax, "vma": vma, "measured_vo2max": vo2max}
+        for sum_key, entry_key, ref_key in _SUMMARY_RATIOS:
+            value, ref = _num(entry_key), refs[ref_key]
+            if value is None or ref is None or ref <= 0:
+                self._set_sum(sum_key, "—")
+            else:
+                self._set_sum(sum_key, f"{round(value / ref * 100)}%")
 
         # Name composite
         ln = _val("last_name")
         fn = _val("first_name")
         name = f"{ln} {fn}".replace("—", "").strip()
-        if "sum_name" in self.summary_labels:
-            self.summary_labels["sum_name"].configure(text=name or "—")
+        self._set_sum("sum_name", name or "—")
 
         # ---------- Lactate graph ----------
         self._update_lactate_graph()
+        self._dirty = False
+
+    def _bind_entry_edits(self):
+        """Flag the summary for refresh whenever any single-line entry changes."""
+        for ei in self.entries.values():
+            if ei['type'] not in ('textbox', 'checkbox'):
+                self._watch_edits(ei['widget'])
+
+    def _watch_edits(self, entry):
+        # "key" validation runs on every insert/delete: typing, any paste,
+        # undo and edits from code alike
+        entry.configure(validate="key", validatecommand=self._edit_vcmd)
+
+    def _on_entry_change(self) -> bool:
+        self._dirty = True
+        return True  # never reject the edit
+
+    def _set_sum(self, key: str, text: str):
+        """Set the text of a summary label, if it exists."""
+        lbl = self.summary_labels.get(key)
+        if lbl is not None:
+            lbl.configure(text=text)
 
     def _update_lactate_graph(self):
         """Render or update the lactate vs speed graph from lactate entries."""
-        # Clear previous canvas
-        if self.lactate_canvas is not None:
-            self.lactate_canvas.get_tk_widget().destroy()
-            self.lactate_canvas = None
-
         # Gather data from lactate entries
         data = self._get_lactate_data()
         if len(data) < 2:
-            # Not enough points — show placeholder
-            placeholder = ctk.CTkLabel(
-                self.lactate_graph_frame, text="Ajoutez au moins 2 mesures de lactate\npour afficher le graphique",
-                text_color="gray", font=ctk.CTkFont(size=12))
-            placeholder.grid(row=0, column=0, padx=20, pady=40)
-            # Store reference to destroy later
-            self._lactate_placeholder = placeholder
+            # Not enough points — hide the graph and show placeholder
+            if self.lactate_canvas is not None:
+                self.lactate_canvas.get_tk_widget().grid_remove()
+            if self._lactate_placeholder is None:
+                self._lactate_placeholder = ctk.CTkLabel(
+                    self.lactate_graph_frame,
+                    text="Ajoutez au moins 2 mesures de lactate\npour afficher le graphique",
+                    text_color="gray", font=get_font(12))
+            self._lactate_placeholder.grid(row=0, column=0, padx=20, pady=40)
             return
 
-        # Remove placeholder if present
-        if hasattr(self, '_lactate_placeholder') and self._lactate_placeholder is not None:
-            try:
-                self._lactate_placeholder.destroy()
-            except Exception:
-                pass
-            self._lactate_placeholder = None
+        if self._lactate_placeholder is not None:
+            self._lactate_placeholder.grid_remove()
 
         # Sort by speed
         data.sort(key=lambda d: d['speed'])
         speeds = [d['speed'] for d in data]
         lactates = [d['lactate_mmol_l'] for d in data]
 
+        # The figure is only rebuilt when the theme changes; otherwise the
+        # existing line is updated in place.
+        mode = ctk.get_appearance_mode()
+        if self.lactate_canvas is None or mode != self._last_appearance_mode:
+            self._build_lactate_figure(mode)
+
+        self._lactate_line.set_data(speeds, lactates)
+        self._lactate_ax.relim()
+        self._lactate_ax.autoscale_view()
+        self.lactate_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+        self.lactate_canvas.draw_idle()
+
+    def _build_lactate_figure(self, mode: str):
+        """Create the lactate figure, axes, line and Tk canvas for the given theme."""
+        if self.lactate_canvas is not None:
+            self.lactate_canvas.get_tk_widget().destroy()
+
         # Detect dark/light theme
-        is_dark = ctk.get_appearance_mode() == "Dark"
+        is_dark = mode == "Dark"
         bg_color = "#2b2b2b" if is_dark else "#f0f0f0"
         text_color = "white" if is_dark else "black"
         grid_color = "#444444" if is_dark else "#cccccc"
 
-        fig, ax = plt.subplots(figsize=(5, 2.8), dpi=100)
+        fig = Figure(figsize=(5, 2.8), dpi=100)
+        ax = fig.add_subplot()
         fig.patch.set_facecolor(bg_color)
         ax.set_facecolor(bg_color)
 
-        ax.plot(speeds, lactates, 'o-', color='#e74c3c', linewidth=2, markersize=6, label='Lactate')
+        line, = ax.plot([], [], 'o-', color='#e74c3c', linewidth=2, markersize=6, label='Lactate')
         ax.set_xlabel("Vitesse (km/h)", color=text_color, fontsize=9)
         ax.set_ylabel("Lactate (mmol/L)", color=text_color, fontsize=9)
         ax.set_title("Profil Lactate", color=text_color, fontsize=11, fontweight='bold')
@@ -600,11 +622,11 @@ class TabbedInputForm(ctk.CTkFrame):
 
         fig.tight_layout(pad=1.5)
 
-        canvas = FigureCanvasTkAgg(fig, master=self.lactate_graph_frame)
-        canvas.draw()
-        canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-        self.lactate_canvas = canvas
-        plt.close(fig)
+        self._lactate_fig = fig
+        self._lactate_ax = ax
+        self._lactate_line = line
+        self.lactate_canvas = FigureCanvasTkAgg(fig, master=self.lactate_graph_frame)
+        self._last_appearance_mode = mode
 
     # ================================================================== #
     #  Helper methods – create widgets                                    #
@@ -625,14 +647,14 @@ class TabbedInputForm(ctk.CTkFrame):
 
         self.db_lookup_btn = ctk.CTkButton(
             email_frame, text="Rechercher", width=80, height=28,
-            font=ctk.CTkFont(size=11),
+            font=get_font(11),
             command=self._trigger_db_lookup,
         )
         self.db_lookup_btn.grid(row=0, column=1, padx=(5, 0))
 
         # Status label (shows result feedback)
         self.db_status_label = ctk.CTkLabel(
-            frame, text="", font=ctk.CTkFont(size=11), text_color="gray"
+            frame, text="", font=get_font(11), text_color="gray"
         )
         self.db_status_label.grid(row=row + 1, column=0, columnspan=2, sticky="w", padx=5)
 
@@ -654,13 +676,13 @@ class TabbedInputForm(ctk.CTkFrame):
             self.db_status_label.configure(text=text, text_color=color)
 
     def _add_section(self, frame, title: str, row: int) -> int:
-        lbl = ctk.CTkLabel(frame, text=title, font=ctk.CTkFont(size=14, weight="bold"))
+        lbl = ctk.CTkLabel(frame, text=title, font=get_font(14, "bold"))
         lbl.grid(row=row, column=0, columnspan=2, pady=(15, 5), sticky="w")
         return row + 1
 
     def _add_subsection(self, frame, title: str, row: int) -> int:
         lbl = ctk.CTkLabel(frame, text=f"  {title}",
-                           font=ctk.CTkFont(size=12, slant="italic"), text_color="gray")
+                           font=get_font(12, slant="italic"), text_color="gray")
         lbl.grid(row=row, column=0, columnspan=2, pady=(8, 2), sticky="w")
         return row + 1
 
@@ -781,7 +803,7 @@ class TabbedInputForm(ctk.CTkFrame):
         for col, prefix, title in [(0, "sv1", "SV1"), (1, "sv2", "SV2")]:
             card = ctk.CTkFrame(tf, corner_radius=8)
             card.grid(row=0, column=col, padx=5, sticky="nsew")
-            ctk.CTkLabel(card, text=title, font=ctk.CTkFont(weight="bold")).grid(
+            ctk.CTkLabel(card, text=title, font=get_font(weight="bold")).grid(
                 row=0, column=0, columnspan=2, pady=5)
             for i, (suffix, lbl) in enumerate([("_hr", "FC"), ("_speed", "Vitesse (km/h)"), ("_vo2", "VO2")]):
                 k = f"{prefix}{suffix}"
@@ -803,7 +825,7 @@ class TabbedInputForm(ctk.CTkFrame):
         for col, suffix, title in [(0, "avant", "Avant"), (1, "apres", "Après")]:
             card = ctk.CTkFrame(rf, corner_radius=8)
             card.grid(row=0, column=col, padx=5, sticky="nsew")
-            ctk.CTkLabel(card, text=title, font=ctk.CTkFont(weight="bold")).grid(
+            ctk.CTkLabel(card, text=title, font=get_font(weight="bold")).grid(
                 row=0, column=0, columnspan=2, pady=5)
             k = f"rsi_{suffix}"
             ctk.CTkLabel(card, text="RSI").grid(row=1, column=0, padx=5, pady=2, sticky="w")
@@ -824,7 +846,7 @@ class TabbedInputForm(ctk.CTkFrame):
         for col, suffix, title in [(0, "avant", "Avant Test"), (1, "apres", "Après Test")]:
             card = ctk.CTkFrame(cf, corner_radius=8)
             card.grid(row=0, column=col, padx=5, sticky="nsew")
-            ctk.CTkLabel(card, text=title, font=ctk.CTkFont(weight="bold")).grid(
+            ctk.CTkLabel(card, text=title, font=get_font(weight="bold")).grid(
                 row=0, column=0, columnspan=2, pady=5)
             for i, (field, lbl) in enumerate([
                 ("hauteur", "Hauteur (cm)"),
@@ -868,13 +890,18 @@ class TabbedInputForm(ctk.CTkFrame):
                            command=lambda: self._remove_lactate_entry(ef))
         rb.grid(row=0, column=4, padx=5)
 
+        self._watch_edits(se)
+        self._watch_edits(le)
+
         self.lactate_entries.append({'frame': ef, 'speed': se, 'lactate': le})
+        self._dirty = True
 
     def _remove_lactate_entry(self, frame):
         for i, entry in enumerate(self.lactate_entries):
             if entry['frame'] == frame:
                 frame.destroy()
                 self.lactate_entries.pop(i)
+                self._dirty = True
                 break
 
     def _get_lactate_data(self) -> List[Dict]:
@@ -1076,6 +1103,7 @@ class TabbedInputForm(ctk.CTkFrame):
         self._update_summary()
 
     def clear(self):
+        self._dirty = True
         for ei in self.entries.values():
             w = ei['widget']
             if ei['type'] == 'textbox':
@@ -1203,7 +1231,7 @@ class TabbedInputForm(ctk.CTkFrame):
     def validate_all(self) -> tuple:
         data = self.get_data()
         try:
-            ProfileFormModel(**data)
+            validate_profile_dict(data)
             self._reset_all_borders()
             return True, "Données valides"
         except ValidationError as e:
@@ -1221,11 +1249,9 @@ class TabbedInputForm(ctk.CTkFrame):
     def _handle_validation_errors(self, error: ValidationError):
         self._reset_all_borders()
         for err in error.errors():
-            loc = err['loc']
-            for key, path in self.field_mapping.items():
-                if path == loc:
-                    self._mark_invalid(key, err['msg'])
-                    break
+            key = PATH_TO_KEY.get(tuple(err['loc']))
+            if key is not None:
+                self._mark_invalid(key, err['msg'])
 
     def _mark_invalid(self, key, msg):
         if key in self.entries:
@@ -1239,7 +1265,7 @@ class TabbedInputForm(ctk.CTkFrame):
     def _on_focus_out(self, key):
         data = self.get_data()
         try:
-            ProfileFormModel(**data)
+            validate_profile_dict(data)
             if key in self.entries:
                 self.entries[key]['widget'].configure(border_color=("gray70", "gray30"))
         except ValidationError as e:
@@ -0,0 +1,28 @@
+"""
+Toast - short-lived status message drawn inside the app window
+"""
+import customtkinter as ctk
+
+from ui.fonts import get_font
+
+TOAST_DURATION_MS = 2500
+
+
+def show_toast(widget, message: str, duration_ms: int = TOAST_DURATION_MS):
+    """
+    Show message at the bottom-right of widget's window for a moment.
+    
+    Unlike messagebox.showinfo this runs no nested event loop and needs no
+    click, so the UI keeps going. A new toast replaces the previous one.
+    """
+    root = widget.winfo_toplevel()
+    previous = getattr(root, '_toast', None)
+    if previous is not None and previous.winfo_exists():
+        previous.destroy()
+    
+    toast = ctk.CTkLabel(root, text=f"  {message}  ", font=get_font(12), justify="left",
+                         fg_color=("gray80", "gray25"), corner_radius=6)
+    toast.place(relx=1.0, rely=1.0, x=-20, y=-20, anchor="se")
+    toast.lift()
+    root._toast = toast
+    toast.after(duration_ms, lambda: toast.winfo_exists() and toast.destroy())
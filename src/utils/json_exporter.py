@@ -1,11 +1,12 @@
 """
 JSON Exporter - Exports transformed data to JSON files
 """
-import json
 import os
 from typing import Dict, Any
 from datetime import datetime
 
+from utils.json_io import dumps_json
+
 
 class JsonExporter:
     """Export transformed test data to JSON files"""
@@ -34,9 +35,9 @@ class JsonExporter:
         if not os.path.isabs(output_path):
             output_path = os.path.join(self.output_dir, output_path)
         
-        # Write JSON with proper formatting
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Write JSON with proper formatting (orjson when installed)
+        with open(output_path, 'wb') as f:
+            f.write(dumps_json(data))
         
         return output_path
     
@@ -0,0 +1,29 @@
+"""
+JSON encoding helpers - uses orjson when available, stdlib json otherwise
+"""
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Encode data as indented UTF-8 JSON bytes.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        Encoded bytes (2-space indent, non-ASCII kept as is)
+    """
+    if orjson is not None:
+        try:
+            # Non-str keys are stringified, like stdlib json does
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits, stdlib json handles those
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')